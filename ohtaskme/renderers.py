@@ -0,0 +1,28 @@
+"""
+Shared renderers for the OhTaskMe API.
+Encodes JSON payloads with orjson instead of the standard library encoder.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    orjson writes dates, datetimes and numbers natively; anything it cannot
+    encode (Decimal, lazy strings, ...) falls back to DRF's own encoder so
+    the output matches ``JSONRenderer``.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    _fallback = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._fallback)
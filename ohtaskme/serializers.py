@@ -0,0 +1,44 @@
+"""
+Shared serializer helpers for the OhTaskMe API.
+"""
+
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class.
+
+    ``ModelSerializer.get_fields()`` re-reads the model's field metadata
+    for every serializer instance. Its result depends only on the class and
+    its ``Meta``, so the first result is kept per class and later instances
+    receive deep copies of those unbound fields, the same way DRF copies
+    ``_declared_fields``. Fields are still bound per instance.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = super().get_fields()
+        return {name: copy.deepcopy(field) for name, field in fields.items()}
+
+
+class SparseFieldsMixin:
+    """
+    Accept a ``fields`` keyword that restricts the serializer's output.
+
+    Fields outside the requested set are dropped before binding, so
+    ``to_representation`` never visits them. Unknown names are ignored.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._only_fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self._only_fields is not None:
+            fields = {name: field for name, field in fields.items() if name in self._only_fields}
+        return fields
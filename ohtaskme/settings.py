@@ -95,6 +95,10 @@ DATABASES = {
         'PASSWORD': 'test123',  # Replace with your actual password
         'HOST': 'localhost',
         'PORT': '5432',
+        # Reuse connections across requests instead of paying the connect
+        # and auth handshake each time; stale ones are checked before reuse
+        'CONN_MAX_AGE': 600,  # seconds
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -160,6 +164,12 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
+    # Rates for views that opt in with ScopedRateThrottle; registration is
+    # bounded tightly because every request hashes a password
+    'DEFAULT_THROTTLE_RATES': {
+        'register': '10/hour',
+        'profile': '200/min',
+    },
 }
 
 # Swagger settings
@@ -2,9 +2,13 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
+from django.utils import timezone
 from rest_framework import status
+from datetime import datetime, time, timedelta
 import json
 
+from tasks.models import Task
+
 User = get_user_model()
 
 class ProjectSetupTests(TestCase):
@@ -54,6 +58,27 @@ class ProjectSetupTests(TestCase):
         response = self.api_client.get('/api/tasks/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
     
+    def test_task_completion_stats(self):
+        """
+        Test that the completion stats endpoint counts each task status.
+        """
+        now = timezone.now()
+        # Halfway to midnight keeps the pending task inside today's window
+        tomorrow = timezone.make_aware(datetime.combine(now.date() + timedelta(days=1), time.min))
+        later_today = now + (tomorrow - now) / 2
+        Task.objects.create(owner=self.user, description='Done', scheduled_time=now - timedelta(days=1), completed=True)
+        Task.objects.create(owner=self.user, description='Late', scheduled_time=now - timedelta(days=1))
+        Task.objects.create(owner=self.user, description='Upcoming', scheduled_time=later_today)
+        
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('api:task_completion_stats'))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['completed'], 1)
+        self.assertEqual(data['overdue'], 1)
+        self.assertEqual(data['pending'], 1)
+        self.assertEqual(data['total'], 3)
+    
     def test_static_files_configuration(self):
         """
         Test that static files are served correctly in development.
@@ -14,6 +14,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include, re_path
 from rest_framework import permissions
@@ -30,6 +31,10 @@ def chrome_devtools_manifest(request):
     """Handle Chrome DevTools manifest request to prevent 404 errors"""
     return JsonResponse({}, status=204)  # Return empty JSON with 204 No Content
 
+# The public schema only changes on deploy, so outside DEBUG the generated
+# document is served from the cache instead of re-introspecting every view
+SCHEMA_CACHE_TIMEOUT = 0 if settings.DEBUG else 60 * 60  # seconds
+
 # Create a schema view for Swagger/OpenAPI documentation
 schema_view = get_schema_view(
     openapi.Info(
@@ -69,8 +74,9 @@ schema_view = get_schema_view(
 )
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
+    # Auth routes first: token refresh is the most frequent request
     path('api/users/', include('users.urls', namespace='users')),
+    path('admin/', admin.site.urls),
     path('api/tasks/', include('tasks.urls', namespace='tasks')),
     path('api/events/', include('events.urls', namespace='events')),
     
@@ -90,7 +96,7 @@ urlpatterns = [
     path('stats/', include('stats.urls', namespace='stats')),
     
     # Swagger documentation URLs
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    re_path(r'^swagger/$', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    re_path(r'^redoc/$', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-json'),
+    re_path(r'^swagger/$', schema_view.with_ui('swagger', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-swagger-ui'),
+    re_path(r'^redoc/$', schema_view.with_ui('redoc', cache_timeout=SCHEMA_CACHE_TIMEOUT), name='schema-redoc'),
 ]
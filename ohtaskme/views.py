@@ -9,7 +9,7 @@ from django.core.paginator import Paginator
 from django.db.models import Q
 from django.utils.dateparse import parse_date
 from django.utils import timezone
-from users.models import User
+from users.models import User, TZ_NAMES
 from tasks.models import Task
 from events.models import Event
 from datetime import datetime, timedelta, date
@@ -138,7 +138,7 @@ def register(request):
     if request.user.is_authenticated:
         return redirect('dashboard')
     
-    timezones = pytz.common_timezones
+    timezones = TZ_NAMES
     
     if request.method == 'POST':
         username = request.POST.get('username')
@@ -183,7 +183,7 @@ def profile(request):
     User profile view and update.
     """
     user = request.user
-    timezones = pytz.common_timezones
+    timezones = TZ_NAMES
     
     if request.method == 'POST':
         # Update user profile
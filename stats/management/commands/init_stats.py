@@ -1,5 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 from stats.models import (
     UserStatistics, DailyStats, AchievementBadge, 
@@ -42,8 +44,10 @@ class Command(BaseCommand):
             users = User.objects.all()
             self.stdout.write(f"Initializing statistics for all {users.count()} users")
 
-        for user in users:
-            self.initialize_user_statistics(user, create_sample)
+        # Commit every user's rows together instead of one commit per INSERT
+        with transaction.atomic():
+            for user in users:
+                self.initialize_user_statistics(user, create_sample)
 
         self.stdout.write(
             self.style.SUCCESS('Successfully initialized statistics system!')
@@ -77,23 +81,24 @@ class Command(BaseCommand):
 
     def update_task_statistics(self, user, user_stats):
         """Update task statistics based on existing data."""
-        tasks = Task.objects.filter(owner=user)
-        completed_tasks = tasks.filter(completed=True)
-        overdue_tasks = tasks.filter(
-            scheduled_time__lt=timezone.now(),
-            completed=False
+        # All three totals in one COUNT ... FILTER pass; the aliases must not
+        # shadow the 'completed' field used in the filters
+        task_counts = Task.objects.filter(owner=user).aggregate(
+            total=Count('pk'),
+            done=Count('pk', filter=Q(completed=True)),
+            late=Count('pk', filter=Q(completed=False, scheduled_time__lt=timezone.now())),
         )
         
-        user_stats.total_tasks_created = tasks.count()
-        user_stats.total_tasks_completed = completed_tasks.count()
-        user_stats.total_tasks_overdue = overdue_tasks.count()
+        user_stats.total_tasks_created = task_counts['total']
+        user_stats.total_tasks_completed = task_counts['done']
+        user_stats.total_tasks_overdue = task_counts['late']
         
         # Update completion rate
         user_stats.update_completion_rate()
         
         # Award XP for existing completed tasks (if not already awarded)
-        if user_stats.total_xp == 0 and completed_tasks.exists():
-            xp_to_award = min(completed_tasks.count() * 10, 200)  # Cap at 200 XP
+        if user_stats.total_xp == 0 and task_counts['done']:
+            xp_to_award = min(task_counts['done'] * 10, 200)  # Cap at 200 XP
             user_stats.add_xp(xp_to_award, "Retroactive task completion bonus")
         
         user_stats.save()
@@ -143,23 +148,30 @@ class Command(BaseCommand):
                 'is_rare': True
             })
         
-        # Create achievements
-        for achievement_data in achievements_to_create:
-            achievement, created = AchievementBadge.objects.get_or_create(
+        # Create missing achievements in one batch
+        existing = set(
+            AchievementBadge.objects.filter(user_statistics=user_stats)
+            .values_list('badge_type', 'title')
+        )
+        now = timezone.now()
+        new_achievements = [
+            AchievementBadge(
                 user_statistics=user_stats,
                 badge_type=achievement_data['badge_type'],
                 title=achievement_data['title'],
-                defaults={
-                    'description': achievement_data['description'],
-                    'icon': achievement_data['icon'],
-                    'color': achievement_data['color'],
-                    'is_rare': achievement_data.get('is_rare', False),
-                    'unlocked_at': timezone.now()
-                }
+                description=achievement_data['description'],
+                icon=achievement_data['icon'],
+                color=achievement_data['color'],
+                is_rare=achievement_data.get('is_rare', False),
+                unlocked_at=now
             )
-            
-            if created:
-                self.stdout.write(f"    ✓ Created achievement: {achievement.title}")
+            for achievement_data in achievements_to_create
+            if (achievement_data['badge_type'], achievement_data['title']) not in existing
+        ]
+        AchievementBadge.objects.bulk_create(new_achievements, batch_size=500)
+        
+        for achievement in new_achievements:
+            self.stdout.write(f"    ✓ Created achievement: {achievement.title}")
 
     def create_initial_streaks(self, user):
         """Create initial streak tracking for the user."""
@@ -210,21 +222,29 @@ class Command(BaseCommand):
             }
         ]
         
-        for streak_data in streaks_to_create:
-            streak, created = StreakTracking.objects.get_or_create(
+        # Create missing streaks in one batch
+        existing = set(
+            StreakTracking.objects.filter(user=user)
+            .values_list('streak_type', 'streak_name')
+        )
+        today = timezone.now().date()
+        new_streaks = [
+            StreakTracking(
                 user=user,
                 streak_type=streak_data['streak_type'],
                 streak_name=streak_data['streak_name'],
-                defaults={
-                    'description': streak_data['description'],
-                    'target_count': streak_data['target_count'],
-                    'milestone_rewards': streak_data['milestone_rewards'],
-                    'last_updated': timezone.now().date()
-                }
+                description=streak_data['description'],
+                target_count=streak_data['target_count'],
+                milestone_rewards=streak_data['milestone_rewards'],
+                last_updated=today
             )
-            
-            if created:
-                self.stdout.write(f"    ✓ Created streak: {streak.streak_name}")
+            for streak_data in streaks_to_create
+            if (streak_data['streak_type'], streak_data['streak_name']) not in existing
+        ]
+        StreakTracking.objects.bulk_create(new_streaks, batch_size=500)
+        
+        for streak in new_streaks:
+            self.stdout.write(f"    ✓ Created streak: {streak.streak_name}")
 
     def create_sample_goals(self, user):
         """Create sample goals for demonstration."""
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-16 04:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0002_xplog_task'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productivityinsights',
+            name='dedupe_key',
+            field=models.CharField(blank=True, help_text='Hash of the time bucket and title for automatically generated insights', max_length=40, null=True),
+        ),
+        migrations.AlterUniqueTogether(
+            name='productivityinsights',
+            unique_together={('user', 'insight_type', 'dedupe_key')},
+        ),
+    ]
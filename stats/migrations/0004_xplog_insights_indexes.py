@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-16 04:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0003_productivityinsights_dedupe_key'),
+        ('tasks', '0002_task_owner_completed_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productivityinsights',
+            index=models.Index(fields=['user', 'is_read', 'is_dismissed'], name='stats_produ_user_id_27540b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='xplog',
+            index=models.Index(fields=['user_statistics', 'timestamp'], name='stats_xplog_user_st_db6393_idx'),
+        ),
+    ]
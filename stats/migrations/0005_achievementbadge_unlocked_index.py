@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-16 04:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0004_xplog_insights_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='achievementbadge',
+            index=models.Index(fields=['user_statistics', 'unlocked_at'], name='stats_achie_user_st_664b08_idx'),
+        ),
+    ]
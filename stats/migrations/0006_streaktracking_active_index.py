@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-16 05:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stats', '0005_achievementbadge_unlocked_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='streaktracking',
+            index=models.Index(fields=['user', 'is_active'], name='stats_strea_user_id_ca43d9_idx'),
+        ),
+    ]
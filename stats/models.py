@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import datetime, timedelta, date
@@ -72,30 +72,36 @@ class UserStatistics(models.Model):
     def __str__(self):
         return f"{self.user.username} - Level {self.current_level} ({self.total_xp} XP)"
     
-    def add_xp(self, points, reason=""):
+    def add_xp(self, points, reason="", task=None):
         """Add XP to user with proper logging and level checking."""
         self.total_xp += points
-        self._check_level_up()
         
-        # Create XP log entry
-        XPLog.objects.create(
-            user_statistics=self,
-            points_earned=points,
-            reason=reason
-        )
-        self.save()
+        # Log entry and counter update share a single commit
+        with transaction.atomic():
+            self._check_level_up()
+            
+            # Create XP log entry
+            XPLog.objects.create(
+                user_statistics=self,
+                points_earned=points,
+                reason=reason,
+                task=task
+            )
+            self.save(update_fields=['total_xp', 'current_level', 'xp_to_next_level', 'last_updated'])
     
-    def remove_xp(self, points, reason=""):
+    def remove_xp(self, points, reason="", task=None):
         """Remove XP from user (for task incompletion, etc.)."""
         self.total_xp = max(0, self.total_xp - points)
         
-        # Create negative XP log entry
-        XPLog.objects.create(
-            user_statistics=self,
-            points_earned=-points,
-            reason=f"Removed: {reason}"
-        )
-        self.save()
+        with transaction.atomic():
+            # Create negative XP log entry
+            XPLog.objects.create(
+                user_statistics=self,
+                points_earned=-points,
+                reason=f"Removed: {reason}",
+                task=task
+            )
+            self.save(update_fields=['total_xp', 'last_updated'])
     
     def _check_level_up(self):
         """Check if user should level up and handle progression."""
@@ -227,6 +233,15 @@ class AchievementBadge(models.Model):
         ('goal_getter', 'Goal Getter'),
         ('custom', 'Custom Achievement')
     ]
+    _BADGE_TYPE_LABELS = dict(BADGE_TYPES)
+    
+    RARITY_LEVELS = [
+        ('common', 'Common'),
+        ('rare', 'Rare'),
+        ('epic', 'Epic'),
+        ('legendary', 'Legendary')
+    ]
+    _RARITY_LABELS = dict(RARITY_LEVELS)
     
     user_statistics = models.ForeignKey(UserStatistics, on_delete=models.CASCADE, related_name='achievements')
     badge_type = models.CharField(max_length=50, choices=BADGE_TYPES)
@@ -240,21 +255,28 @@ class AchievementBadge(models.Model):
     is_rare = models.BooleanField(default=False, help_text="Rare achievements are harder to obtain")
     rarity_level = models.CharField(
         max_length=20,
-        choices=[
-            ('common', 'Common'),
-            ('rare', 'Rare'),
-            ('epic', 'Epic'),
-            ('legendary', 'Legendary')
-        ],
+        choices=RARITY_LEVELS,
         default='common'
     )
     
     class Meta:
         unique_together = ['user_statistics', 'badge_type', 'title']
         ordering = ['-unlocked_at']
+        indexes = [
+            # Gallery and today's-achievements lookups: one user's badges by unlock time
+            models.Index(fields=['user_statistics', 'unlocked_at']),
+        ]
     
     def __str__(self):
         return f"{self.user_statistics.user.username} - {self.title}"
+    
+    def get_badge_type_display(self):
+        """Return the badge type label from a prebuilt lookup instead of rebuilding the choices dict."""
+        return self._BADGE_TYPE_LABELS.get(self.badge_type, self.badge_type)
+    
+    def get_rarity_level_display(self):
+        """Return the rarity label from a prebuilt lookup instead of rebuilding the choices dict."""
+        return self._RARITY_LABELS.get(self.rarity_level, self.rarity_level)
 
 
 class StreakTracking(models.Model):
@@ -291,6 +313,10 @@ class StreakTracking(models.Model):
     class Meta:
         unique_together = ['user', 'streak_type', 'streak_name']
         ordering = ['-current_count']
+        indexes = [
+            # Streak status and streaks-at-risk: one user's active streaks
+            models.Index(fields=['user', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.streak_name}: {self.current_count}"
@@ -302,7 +328,7 @@ class StreakTracking(models.Model):
             self.best_count = self.current_count
             
         self.last_updated = timezone.now().date()
-        self.save()
+        self.save(update_fields=['current_count', 'best_count', 'last_updated'])
         
         # Check for milestone rewards
         self._check_milestone_rewards()
@@ -311,7 +337,7 @@ class StreakTracking(models.Model):
         """Reset the current streak count."""
         self.current_count = 0
         self.last_updated = timezone.now().date()
-        self.save()
+        self.save(update_fields=['current_count', 'last_updated'])
     
     def is_active_today(self):
         """Check if the streak was already updated today."""
@@ -415,7 +441,7 @@ class UserGoals(models.Model):
         if self.current_progress >= self.target_value:
             self.mark_completed()
         
-        self.save()
+        self.save(update_fields=['current_progress', 'updated_at'])
     
     def mark_completed(self):
         """Mark goal as completed and award rewards."""
@@ -435,7 +461,7 @@ class UserGoals(models.Model):
             defaults={'unlocked_at': timezone.now()}
         )
         
-        self.save()
+        self.save(update_fields=['status', 'completed_date', 'updated_at'])
 
 
 class XPLog(models.Model):
@@ -448,12 +474,24 @@ class XPLog(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
     
     # Optional references
+    task = models.ForeignKey(
+        'tasks.Task',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=True,
+        related_name='xp_logs'
+    )
     related_task_id = models.IntegerField(null=True, blank=True)
     related_event_id = models.IntegerField(null=True, blank=True)
     related_goal_id = models.IntegerField(null=True, blank=True)
     
     class Meta:
         ordering = ['-timestamp']
+        indexes = [
+            # Recent XP and XP progression: one user's logs by time
+            models.Index(fields=['user_statistics', 'timestamp']),
+        ]
     
     def __str__(self):
         return f"{self.user_statistics.user.username} - {self.points_earned} XP - {self.reason}"
@@ -501,8 +539,21 @@ class ProductivityInsights(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField(null=True, blank=True)
     
+    # Generated insights sharing a key are only stored once
+    dedupe_key = models.CharField(
+        max_length=40,
+        null=True,
+        blank=True,
+        help_text="Hash of the time bucket and title for automatically generated insights"
+    )
+    
     class Meta:
+        unique_together = ['user', 'insight_type', 'dedupe_key']
         ordering = ['-created_at']
+        indexes = [
+            # Dashboard unread insights: user + read/dismissed flags
+            models.Index(fields=['user', 'is_read', 'is_dismissed']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.title}"
@@ -63,9 +63,15 @@ class StreakTrackingSerializer(serializers.ModelSerializer):
 
 
 class UserGoalsSerializer(serializers.ModelSerializer):
-    """Serializer for UserGoals model."""
-    progress_percentage = serializers.ReadOnlyField()
-    days_remaining = serializers.ReadOnlyField()
+    """
+    Serializer for UserGoals model.
+    
+    Expects a queryset annotated with ``progress_pct`` and ``days_left``
+    (see ``stats.views._annotate_goal_progress``) so the derived values are
+    computed once in SQL instead of per instance in Python.
+    """
+    progress_percentage = serializers.FloatField(source='progress_pct', read_only=True)
+    days_remaining = serializers.IntegerField(source='days_left.days', read_only=True)
     
     class Meta:
         model = UserGoals
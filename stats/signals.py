@@ -15,9 +15,13 @@ Key Principles:
 
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
+from django.db import connection, transaction
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Q, Count, Avg
+from django.db.models import Q, F, Count, Avg, Max
 from datetime import datetime, timedelta, time
+from threading import local
+import hashlib
 import logging
 
 from tasks.models import Task
@@ -29,6 +33,26 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Re-entry guard for signal handlers that write rows firing further signals
+_guard = local()
+
+WEEKLY_PATTERNS_CACHE_TTL = 300  # seconds
+CONSISTENCY_CACHE_TTL = 3600  # seconds
+
+
+def get_analytics_version(user_id):
+    """Return the per-user counter that cached analytics keys embed."""
+    return cache.get(f'stats:analytics_version:{user_id}', 0)
+
+
+def bump_analytics_version(user_id):
+    """Move a user's cached analytics to fresh keys after their stats change."""
+    key = f'stats:analytics_version:{user_id}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
 # ============================================================================
 # TASK COMPLETION TRACKING
 # ============================================================================
@@ -38,20 +62,77 @@ def track_task_completion(sender, instance, created, **kwargs):
     """
     Track task completion and update real-time statistics.
     
-    This signal fires whenever a task is saved and calculates:
+    The analytics pipeline is deferred until the surrounding transaction
+    commits, so the task write itself only pays for its own INSERT/UPDATE
+    and a rolled-back save never touches the statistics tables. Edits that
+    leave ``completed`` unchanged (renames, rescheduling) are skipped.
+    
+    Changes are queued on the database connection and flushed once per
+    commit, so completing several tasks in one transaction recomputes each
+    owner's daily score a single time.
+    """
+    if not instance.owner_id:
+        return
+    
+    previously_completed = getattr(instance, '_original_completed', None)
+    instance._original_completed = instance.completed
+    if not created and instance.completed == previously_completed:
+        return
+    
+    pending = getattr(connection, 'stats_pending_tasks', None)
+    if pending is None:
+        pending = connection.stats_pending_tasks = {}
+    
+    user_tasks = pending.setdefault(instance.owner_id, {})
+    if instance.pk in user_tasks:
+        # Keep the state from before the first change in this transaction
+        user_tasks[instance.pk]['completed'] = instance.completed
+    else:
+        # A new task starts from its initial state, so one created already
+        # completed is no change, but create-then-complete in one
+        # transaction still counts
+        user_tasks[instance.pk] = {
+            'was_completed': instance.completed if created else bool(previously_completed),
+            'completed': instance.completed,
+        }
+    
+    transaction.on_commit(_flush_pending_task_stats)
+
+def _flush_pending_task_stats():
+    """Run the stats pipeline once per user for all tasks queued so far."""
+    pending = getattr(connection, 'stats_pending_tasks', None)
+    if not pending:
+        return
+    
+    connection.stats_pending_tasks = {}
+    for user_id, task_changes in pending.items():
+        update_stats_for_tasks(user_id, task_changes)
+        bump_analytics_version(user_id)
+
+def update_stats_for_tasks(user_id, task_changes):
+    """
+    Update real-time statistics for a user's committed task changes.
+    
+    ``task_changes`` maps task ids to their completion state before and
+    after the transaction. This calculates:
     - Daily task completion counts
     - Productivity scores based on completion patterns
     - XP rewards for different types of completions
     - Streak tracking for consistent behavior
     """
-    if not instance.owner:
-        return
-    
     try:
+        tasks = Task.objects.select_related('owner').in_bulk(list(task_changes))
+        if not tasks:
+            return
+        owner = next(iter(tasks.values())).owner
+        
+        # Resolve the clock once for the whole pipeline
+        now = timezone.now()
+        today = now.date()
+        
         # Get or create today's stats
-        today = timezone.now().date()
         daily_stats, _ = DailyStats.objects.get_or_create(
-            user=instance.owner,
+            user=owner,
             date=today,
             defaults={
                 'daily_productivity_score': 0.0,
@@ -61,70 +142,92 @@ def track_task_completion(sender, instance, created, **kwargs):
         )
         
         # Get or create user statistics
-        user_stats, _ = UserStatistics.objects.get_or_create(user=instance.owner)
+        user_stats, _ = UserStatistics.objects.get_or_create(user=owner)
         
-        # If task was just completed (not created as completed)
-        if instance.completed and not created:
-            _handle_task_completion(instance, daily_stats, user_stats)
+        completion_changed = False
+        for task_id, change in task_changes.items():
+            instance = tasks.get(task_id)
             
-        # If task was marked incomplete
-        elif not instance.completed and not created:
-            _handle_task_incompletion(instance, daily_stats, user_stats)
+            # Skip deleted tasks and changes left over from a rolled-back transaction
+            if instance is None or instance.completed != change['completed']:
+                continue
+            if change['completed'] == change['was_completed']:
+                continue
             
+            completion_changed = True
+            if change['completed']:
+                _handle_task_completion(instance, daily_stats, user_stats, now)
+            else:
+                _handle_task_incompletion(instance, daily_stats, user_stats)
+        
         # Update productivity score based on current task state
-        _update_daily_productivity_score(daily_stats)
+        _update_daily_productivity_score(daily_stats, now)
+        
+        # Persist without re-dispatching post_save, then run the follow-ups directly
+        DailyStats.objects.filter(pk=daily_stats.pk).update(
+            tasks_overdue=daily_stats.tasks_overdue,
+            daily_productivity_score=daily_stats.daily_productivity_score
+        )
+        _monitor_daily_stats(daily_stats, user_stats)
+        if completion_changed:
+            check_and_award_achievements(owner, user_stats)
         
     except Exception as e:
-        logger.error(f"Error in track_task_completion: {e}")
+        logger.error(f"Error in update_stats_for_tasks: {e}")
 
-def _handle_task_completion(task, daily_stats, user_stats):
+def _handle_task_completion(task, daily_stats, user_stats, now):
     """Handle when a task is marked as completed."""
     
-    # Update daily stats
-    daily_stats.tasks_completed += 1
+    # Update daily and user counters in the database to avoid lost updates
+    DailyStats.objects.filter(pk=daily_stats.pk).update(
+        tasks_completed=F('tasks_completed') + 1
+    )
+    UserStatistics.objects.filter(pk=user_stats.pk).update(
+        total_tasks_completed=F('total_tasks_completed') + 1
+    )
+    daily_stats.refresh_from_db(fields=['tasks_completed'])
+    user_stats.refresh_from_db(fields=['total_tasks_completed'])
     
     # Calculate completion timing for productivity insights
-    now = timezone.now()
     completion_score = _calculate_completion_score(task, now)
     
-    # Update user statistics
-    user_stats.total_tasks_completed += 1
-    
     # Calculate and award XP based on task characteristics
     xp_earned = _calculate_task_xp(task, completion_score)
-    user_stats.add_xp(xp_earned, f"Completed: {task.description[:50]}")
+    user_stats.add_xp(xp_earned, f"Completed: {task.description[:50]}", task=task)
     
     # Update streaks
-    _update_task_completion_streaks(task.owner, daily_stats)
-    
-    # Save changes
-    daily_stats.save()
-    user_stats.save()
+    _update_task_completion_streaks(task.owner, daily_stats, now.date())
     
     # Generate insights for patterns
-    _generate_completion_insights(task, completion_score)
+    _generate_completion_insights(task, completion_score, now)
 
 def _handle_task_incompletion(task, daily_stats, user_stats):
     """Handle when a task is marked as incomplete."""
     
     # Only adjust if we had counted this completion today
-    if daily_stats.tasks_completed > 0:
-        daily_stats.tasks_completed -= 1
-        user_stats.total_tasks_completed = max(0, user_stats.total_tasks_completed - 1)
+    decremented = DailyStats.objects.filter(
+        pk=daily_stats.pk, tasks_completed__gt=0
+    ).update(tasks_completed=F('tasks_completed') - 1)
+    
+    if decremented:
+        UserStatistics.objects.filter(
+            pk=user_stats.pk, total_tasks_completed__gt=0
+        ).update(total_tasks_completed=F('total_tasks_completed') - 1)
+        daily_stats.refresh_from_db(fields=['tasks_completed'])
+        user_stats.refresh_from_db(fields=['total_tasks_completed'])
         
         # Remove XP that was awarded (find the most recent XP log for this task)
         recent_xp = XPLog.objects.filter(
             user_statistics__user=task.owner,
-            timestamp__date=timezone.now().date(),
-            reason__icontains=task.description[:20]
-        ).first()
+            task_id=task.pk,
+            points_earned__gt=0
+        ).order_by('-timestamp').first()
         
         if recent_xp:
-            user_stats.remove_xp(recent_xp.points_earned, f"Reverted: {task.description[:50]}")
-            recent_xp.delete()
-        
-        daily_stats.save()
-        user_stats.save()
+            # Revert and delete the log entry together
+            with transaction.atomic():
+                user_stats.remove_xp(recent_xp.points_earned, f"Reverted: {task.description[:50]}", task=task)
+                recent_xp.delete()
 
 def _calculate_completion_score(task, completion_time):
     """
@@ -197,7 +300,7 @@ def _calculate_task_xp(task, completion_score):
     
     return max(5, final_xp)  # Minimum 5 XP per task
 
-def _update_task_completion_streaks(user, daily_stats):
+def _update_task_completion_streaks(user, daily_stats, today):
     """Update streak tracking for task completion patterns."""
     
     # Daily task completion streak
@@ -205,18 +308,20 @@ def _update_task_completion_streaks(user, daily_stats):
         user=user,
         streak_type='daily_tasks',
         defaults={
+            'streak_name': 'Daily Task Completion',
             'current_count': 0,
             'target_count': 3,  # 3 tasks per day target
-            'description': 'Complete at least 3 tasks daily'
+            'description': 'Complete at least 3 tasks daily',
+            'last_updated': today - timedelta(days=1)
         }
     )
     
     # Check if user hit their daily target
     if daily_stats.tasks_completed >= task_streak.target_count:
-        if not task_streak.is_active_today():
+        if task_streak.last_updated != today:
             task_streak.increment_streak()
 
-def _update_daily_productivity_score(daily_stats):
+def _update_daily_productivity_score(daily_stats, now):
     """
     Calculate and update the daily productivity score.
     
@@ -233,46 +338,57 @@ def _update_daily_productivity_score(daily_stats):
     # Base score from task completion
     base_score = daily_stats.tasks_completed * 10
     
-    # Penalty for overdue tasks
-    overdue_count = Task.objects.filter(
-        owner=user,
-        completed=False,
-        scheduled_time__lt=timezone.now()
-    ).count()
+    # Overdue tasks and morning completions (before noon) in a single query
+    task_counts = Task.objects.filter(owner=user).aggregate(
+        overdue=Count('pk', filter=Q(completed=False, scheduled_time__lt=now)),
+        morning=Count('pk', filter=Q(
+            completed=True,
+            completed_at__date=now.date(),
+            completed_at__hour__lt=12
+        ))
+    )
     
+    # Penalty for overdue tasks
+    overdue_count = task_counts['overdue']
     daily_stats.tasks_overdue = overdue_count
     overdue_penalty = overdue_count * 5
     
     # Time-of-day bonus for early completions
-    today_completions = Task.objects.filter(
-        owner=user,
-        completed=True,
-        completed_at__date=timezone.now().date(),
-        completed_at__hour__lt=12  # Completed before noon
-    ).count()
-    
-    morning_bonus = today_completions * 3
+    morning_bonus = task_counts['morning'] * 3
     
     # Consistency bonus (completed tasks on consecutive days)
-    consistency_bonus = _calculate_consistency_bonus(user)
+    consistency_bonus = _calculate_consistency_bonus(
+        user, now.date(), daily_stats.tasks_completed >= 1
+    )
     
     # Calculate final score
     raw_score = base_score - overdue_penalty + morning_bonus + consistency_bonus
     daily_stats.daily_productivity_score = max(0, min(100, raw_score))
-    
-    daily_stats.save()
 
-def _calculate_consistency_bonus(user):
-    """Calculate bonus points for consistent daily task completion."""
+def _calculate_consistency_bonus(user, today, completed_today):
+    """
+    Calculate bonus points for consistent daily task completion.
+    
+    Only the previous days are counted in the database; that count cannot
+    change until tomorrow, so it is cached per user and day. Today's
+    contribution comes from the caller's in-memory stats.
+    """
     
     # Look at last 7 days
-    last_week = timezone.now().date() - timedelta(days=7)
+    last_week = today - timedelta(days=7)
     
-    daily_completions = DailyStats.objects.filter(
-        user=user,
-        date__gte=last_week,
-        tasks_completed__gte=1
-    ).count()
+    cache_key = f'stats:consistency:{user.pk}:{today.isoformat()}'
+    previous_days = cache.get(cache_key)
+    if previous_days is None:
+        previous_days = DailyStats.objects.filter(
+            user=user,
+            date__gte=last_week,
+            date__lt=today,
+            tasks_completed__gte=1
+        ).count()
+        cache.set(cache_key, previous_days, CONSISTENCY_CACHE_TTL)
+    
+    daily_completions = previous_days + (1 if completed_today else 0)
     
     # Bonus points for consistent daily completion
     if daily_completions >= 7:
@@ -284,7 +400,7 @@ def _calculate_consistency_bonus(user):
     
     return 0
 
-def _generate_completion_insights(task, completion_score):
+def _generate_completion_insights(task, completion_score, now):
     """Generate productivity insights based on completion patterns."""
     
     user = task.owner
@@ -292,31 +408,47 @@ def _generate_completion_insights(task, completion_score):
     # Detect patterns and generate insights
     if completion_score >= 1.5:
         # High-productivity completion
+        title = "Excellent timing"
         insight_text = f"Great job! You completed '{task.description[:30]}...' with excellent timing and efficiency."
-        insight_type = "achievement"
+        insight_type = "achievement_opportunity"
         
     elif completion_score <= 0.7:
         # Room for improvement
+        title = "Schedule tasks earlier"
         insight_text = f"Consider scheduling your tasks earlier to boost productivity. Task '{task.description[:30]}...' was completed late."
-        insight_type = "suggestion"
+        insight_type = "productivity_tip"
         
     else:
         return  # No insight needed for average completion
     
-    # Create insight if it doesn't exist recently
-    recent_similar = ProductivityInsights.objects.filter(
-        user=user,
-        created_at__gte=timezone.now() - timedelta(hours=2),
-        insight_type=insight_type
-    ).exists()
+    # At most one insight of each kind per two-hour window
+    bucket = f"{now.date().isoformat()}:{now.hour // 2}"
+    _save_insights([
+        _build_insight(user, insight_type, title, insight_text, bucket, confidence=0.8)
+    ])
+
+def _build_insight(user, insight_type, title, message, bucket='', confidence=1.0):
+    """
+    Build an unsaved insight keyed for deduplication.
     
-    if not recent_similar:
-        ProductivityInsights.objects.create(
-            user=user,
-            insight_text=insight_text,
-            insight_type=insight_type,
-            is_read=False
-        )
+    Insights with the same user, type, title and ``bucket`` share a
+    ``dedupe_key``, so saving them with ``_save_insights`` keeps the first one
+    and silently drops the rest.
+    """
+    dedupe_key = hashlib.sha1(f"{bucket}|{title}".encode()).hexdigest()
+    return ProductivityInsights(
+        user=user,
+        insight_type=insight_type,
+        title=title,
+        message=message,
+        confidence_score=confidence,
+        dedupe_key=dedupe_key,
+        is_read=False
+    )
+
+def _save_insights(insights):
+    """Insert insights in one query, skipping any that already exist."""
+    ProductivityInsights.objects.bulk_create(insights, ignore_conflicts=True)
 
 # ============================================================================
 # EVENT ATTENDANCE TRACKING
@@ -345,41 +477,67 @@ def track_event_creation(sender, instance, created, **kwargs):
 def _update_planning_streak(user):
     """Update streak for consistent event planning."""
     
+    today = timezone.now().date()
     planning_streak, created = StreakTracking.objects.get_or_create(
         user=user,
         streak_type='weekly_planning',
         defaults={
+            'streak_name': 'Weekly Planning',
             'current_count': 0,
             'target_count': 1,  # Create at least 1 event per week
-            'description': 'Plan ahead by creating events weekly'
+            'description': 'Plan ahead by creating events weekly',
+            'last_updated': today - timedelta(days=1)
         }
     )
     
     # Check if user created an event this week
-    week_start = timezone.now().date() - timedelta(days=timezone.now().weekday())
+    week_start = today - timedelta(days=today.weekday())
     this_week_events = Event.objects.filter(
         owner=user,
         created_at__date__gte=week_start
     ).count()
     
     if this_week_events >= planning_streak.target_count:
-        if not planning_streak.is_active_today():
+        if planning_streak.last_updated != today:
             planning_streak.increment_streak()
 
 # ============================================================================
 # REAL-TIME PRODUCTIVITY MONITORING
 # ============================================================================
 
+@receiver(post_save, sender=DailyStats)
+def invalidate_cached_analytics(sender, instance, **kwargs):
+    """Expire cached dashboard analytics whenever a day's stats are saved."""
+    bump_analytics_version(instance.user_id)
+
 @receiver(post_save, sender=DailyStats)
 def monitor_daily_progress(sender, instance, created, **kwargs):
     """Monitor daily progress and provide real-time feedback."""
     
-    if not created:  # Only run on updates
-        _check_daily_milestones(instance)
-        _update_weekly_patterns(instance)
+    if created or getattr(_guard, 'active', False):  # Only run on updates, never re-entrantly
+        return
+    
+    _guard.active = True
+    try:
+        _monitor_daily_stats(instance)
+    finally:
+        _guard.active = False
+
+def _monitor_daily_stats(daily_stats, user_stats=None):
+    """Award daily milestones and refresh weekly pattern insights."""
+    
+    xp_to_add, insights_to_create = _check_daily_milestones(daily_stats)
+    if xp_to_add or insights_to_create:
+        _apply_daily_milestones(daily_stats, user_stats, xp_to_add, insights_to_create)
+    _update_weekly_patterns(daily_stats)
 
 def _check_daily_milestones(daily_stats):
-    """Check if user hit important daily milestones."""
+    """
+    Check if user hit important daily milestones.
+    
+    Returns ``(xp_to_add, insights_to_create)`` without touching the database
+    so the caller can write everything in one go.
+    """
     
     user = daily_stats.user
     milestones = [
@@ -389,88 +547,140 @@ def _check_daily_milestones(daily_stats):
         (10, "Incredible! Double digits achieved! 🌟")
     ]
     
+    xp_to_add = 0
+    insights_to_create = []
+    
     for milestone_count, message in milestones:
         if daily_stats.tasks_completed == milestone_count:
             # Award milestone XP
-            milestone_xp = milestone_count * 3
-            user_stats, _ = UserStatistics.objects.get_or_create(user=user)
-            user_stats.add_xp(milestone_xp, f"Daily milestone: {milestone_count} tasks")
+            xp_to_add += milestone_count * 3
             
             # Create achievement insight
-            ProductivityInsights.objects.create(
-                user=user,
-                insight_text=message,
-                insight_type="achievement",
-                is_read=False
+            insights_to_create.append(_build_insight(
+                user, 'achievement_opportunity',
+                f"Daily milestone: {milestone_count} tasks", message,
+                bucket=daily_stats.date.isoformat()
+            ))
+    
+    return xp_to_add, insights_to_create
+
+def _apply_daily_milestones(daily_stats, user_stats, xp_to_add, insights_to_create):
+    """Persist milestone insights and XP with one insert batch and one update."""
+    
+    with transaction.atomic():
+        _save_insights(insights_to_create)
+        
+        if xp_to_add:
+            if user_stats is None:
+                user_stats, _ = UserStatistics.objects.get_or_create(user=daily_stats.user)
+            
+            XPLog.objects.create(
+                user_statistics=user_stats,
+                points_earned=xp_to_add,
+                reason=f"Daily milestone: {daily_stats.tasks_completed} tasks"
+            )
+            # Keep the loaded copy in step for callers that save it afterwards,
+            # and carry any level-up into the same UPDATE
+            user_stats.total_xp += xp_to_add
+            user_stats._check_level_up()
+            UserStatistics.objects.filter(pk=user_stats.pk).update(
+                total_xp=F('total_xp') + xp_to_add,
+                current_level=user_stats.current_level,
+                xp_to_next_level=user_stats.xp_to_next_level
             )
 
 def _update_weekly_patterns(daily_stats):
     """Analyze weekly patterns for insights."""
     
     user = daily_stats.user
+    today = timezone.now().date()
     
-    # Calculate weekly average
-    week_start = timezone.now().date() - timedelta(days=7)
-    weekly_stats = DailyStats.objects.filter(
-        user=user,
-        date__gte=week_start
-    )
+    # Calculate weekly average, memoized per user and day
+    cache_key = f'stats:weekly_patterns:{user.pk}:{today.isoformat()}'
+    weekly = cache.get(cache_key)
+    if weekly is None:
+        weekly = DailyStats.objects.filter(
+            user=user,
+            date__gte=today - timedelta(days=7)
+        ).aggregate(
+            days=Count('pk'),
+            avg_tasks=Avg('tasks_completed'),
+            avg_productivity=Avg('daily_productivity_score')
+        )
+        cache.set(cache_key, weekly, WEEKLY_PATTERNS_CACHE_TTL)
     
-    if weekly_stats.count() >= 7:  # Full week of data
-        avg_tasks = weekly_stats.aggregate(avg=Avg('tasks_completed'))['avg'] or 0
-        avg_productivity = weekly_stats.aggregate(avg=Avg('daily_productivity_score'))['avg'] or 0
+    if weekly['days'] >= 7:  # Full week of data
+        avg_tasks = weekly['avg_tasks'] or 0
+        avg_productivity = weekly['avg_productivity'] or 0
         
         # Detect trends
+        insights = []
         if avg_tasks >= 5:
-            insight = "You're consistently completing 5+ tasks daily! Excellent habit building! 🌱"
-            ProductivityInsights.objects.get_or_create(
-                user=user,
-                insight_text=insight,
-                insight_type="pattern",
-                defaults={'is_read': False}
-            )
+            insights.append(_build_insight(
+                user, 'pattern_analysis', "Consistent daily output",
+                "You're consistently completing 5+ tasks daily! Excellent habit building! 🌱",
+                confidence=0.9
+            ))
         
         if avg_productivity >= 80:
-            insight = "Your productivity score is consistently high! You're mastering intentional living! 🎯"
-            ProductivityInsights.objects.get_or_create(
-                user=user,
-                insight_text=insight,
-                insight_type="achievement",
-                defaults={'is_read': False}
-            )
+            insights.append(_build_insight(
+                user, 'achievement_opportunity', "Consistently high productivity",
+                "Your productivity score is consistently high! You're mastering intentional living! 🎯",
+                confidence=0.9
+            ))
+        
+        if insights:
+            _save_insights(insights)
 
 # ============================================================================
 # STREAK MONITORING & ACHIEVEMENTS
 # ============================================================================
 
-def check_and_award_achievements(user):
+# (badge_type, threshold, stat_type, title, description)
+_ACHIEVEMENTS = (
+    # Task completion achievements
+    ('first_task', 1, 'tasks', "First Step", "Completed your first task! 🎯"),
+    ('task_novice', 10, 'tasks', "Task Novice", "Completed 10 tasks! Building momentum! 🚀"),
+    ('task_adept', 50, 'tasks', "Task Adept", "50 tasks completed! You're getting good at this! 💪"),
+    ('task_master', 100, 'tasks', "Task Master", "100 tasks! You're a productivity master! 🏆"),
+    ('task_legend', 500, 'tasks', "Task Legend", "500 tasks! Legendary dedication! 🌟"),
+    
+    # XP achievements
+    ('xp_beginner', 100, 'xp', "Getting Started", "Earned your first 100 XP! 🎮"),
+    ('xp_rising', 500, 'xp', "Rising Star", "500 XP earned! You're rising! ⭐"),
+    ('xp_champion', 1000, 'xp', "XP Champion", "1000 XP! True champion! 🏅"),
+    ('xp_master', 5000, 'xp', "XP Master", "5000 XP! Mastery achieved! 👑"),
+    
+    # Streak achievements
+    ('streak_starter', 3, 'streak', "Streak Starter", "3-day streak! Building habits! 🔥"),
+    ('streak_builder', 7, 'streak', "Streak Builder", "Week-long streak! Consistency wins! 📈"),
+    ('streak_master', 30, 'streak', "Streak Master", "30-day streak! Incredible discipline! 🏔️"),
+)
+
+def check_and_award_achievements(user, user_stats=None):
     """Check for achievement unlocks based on current statistics."""
     
-    user_stats, _ = UserStatistics.objects.get_or_create(user=user)
+    if user_stats is None:
+        user_stats, _ = UserStatistics.objects.get_or_create(user=user)
     
-    achievements = [
-        # Task completion achievements
-        ('first_task', 1, 'tasks', "First Step", "Completed your first task! 🎯"),
-        ('task_novice', 10, 'tasks', "Task Novice", "Completed 10 tasks! Building momentum! 🚀"),
-        ('task_adept', 50, 'tasks', "Task Adept", "50 tasks completed! You're getting good at this! 💪"),
-        ('task_master', 100, 'tasks', "Task Master", "100 tasks! You're a productivity master! 🏆"),
-        ('task_legend', 500, 'tasks', "Task Legend", "500 tasks! Legendary dedication! 🌟"),
-        
-        # XP achievements
-        ('xp_beginner', 100, 'xp', "Getting Started", "Earned your first 100 XP! 🎮"),
-        ('xp_rising', 500, 'xp', "Rising Star", "500 XP earned! You're rising! ⭐"),
-        ('xp_champion', 1000, 'xp', "XP Champion", "1000 XP! True champion! 🏅"),
-        ('xp_master', 5000, 'xp', "XP Master", "5000 XP! Mastery achieved! 👑"),
-        
-        # Streak achievements
-        ('streak_starter', 3, 'streak', "Streak Starter", "3-day streak! Building habits! 🔥"),
-        ('streak_builder', 7, 'streak', "Streak Builder", "Week-long streak! Consistency wins! 📈"),
-        ('streak_master', 30, 'streak', "Streak Master", "30-day streak! Incredible discipline! 🏔️"),
-    ]
+    # Badge types already earned, fetched once for in-memory membership tests
+    earned_types = set(
+        AchievementBadge.objects.filter(user_statistics=user_stats)
+        .values_list('badge_type', flat=True)
+    )
+    
+    # Best streak ever reached, shared by all streak achievements
+    max_streak = StreakTracking.objects.filter(user=user).aggregate(
+        max_streak=Max('best_count')
+    )['max_streak'] or 0
     
-    for achievement_id, threshold, stat_type, title, description in achievements:
+    now = timezone.now()
+    new_badges = []
+    rewards = []
+    
+    for achievement_id, threshold, stat_type, title, description in _ACHIEVEMENTS:
         # Check if already earned
-        if AchievementBadge.objects.filter(user_statistics=user_stats, badge_type=achievement_id).exists():
+        if achievement_id in earned_types:
             continue
         
         # Check if threshold met
@@ -479,39 +689,59 @@ def check_and_award_achievements(user):
             earned = True
         elif stat_type == 'xp' and user_stats.total_xp >= threshold:
             earned = True
-        elif stat_type == 'streak':
-            max_streak = StreakTracking.objects.filter(user=user).aggregate(
-                max_streak=Count('longest_streak')
-            )['max_streak'] or 0
-            if max_streak >= threshold:
-                earned = True
+        elif stat_type == 'streak' and max_streak >= threshold:
+            earned = True
         
         if earned:
-            # Award achievement
-            AchievementBadge.objects.create(
+            new_badges.append(AchievementBadge(
                 user_statistics=user_stats,
                 badge_type=achievement_id,
                 title=title,
                 description=description,
                 icon="trophy",
                 color="gold",
-                unlocked_at=timezone.now()
-            )
-            
-            # Award bonus XP
-            bonus_xp = threshold // 10 + 10
-            user_stats.add_xp(bonus_xp, f"Achievement: {title}")
-            
-            # Create insight
-            ProductivityInsights.objects.create(
-                user=user,
-                insight_text=f"🏆 Achievement Unlocked: {title}! {description}",
-                insight_type="achievement",
-                is_read=False
-            )
+                unlocked_at=now
+            ))
+            rewards.append((threshold, title, description))
+    
+    if not new_badges:
+        return
+    
+    # Award bonus XP with one log batch and one UPDATE; update() does not
+    # fire post_save, so this never re-enters auto_check_achievements
+    xp_logs = [
+        XPLog(
+            user_statistics=user_stats,
+            points_earned=threshold // 10 + 10,
+            reason=f"Achievement: {title}"
+        )
+        for threshold, title, _ in rewards
+    ]
+    bonus_xp = sum(log.points_earned for log in xp_logs)
+    
+    with transaction.atomic():
+        AchievementBadge.objects.bulk_create(new_badges)
+        XPLog.objects.bulk_create(xp_logs)
+        
+        user_stats.total_xp += bonus_xp
+        user_stats._check_level_up()
+        UserStatistics.objects.filter(pk=user_stats.pk).update(
+            total_xp=F('total_xp') + bonus_xp,
+            current_level=user_stats.current_level,
+            xp_to_next_level=user_stats.xp_to_next_level
+        )
+    
+    # Create insights
+    _save_insights([
+        _build_insight(
+            user, 'achievement_opportunity', f"Achievement Unlocked: {title}",
+            f"🏆 Achievement Unlocked: {title}! {description}"
+        )
+        for _, title, description in rewards
+    ])
 
 # Auto-run achievement checks when user stats update
 @receiver(post_save, sender=UserStatistics)
 def auto_check_achievements(sender, instance, **kwargs):
     """Automatically check for new achievements when user stats update."""
-    check_and_award_achievements(instance.user)
+    check_and_award_achievements(instance.user, instance)
@@ -2,8 +2,10 @@
 Debug script to test chart data generation directly
 """
 import os
+import sys
 import django
-import json
+import numpy as np
+import orjson
 
 # Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ohtaskme.settings')
@@ -14,65 +16,75 @@ from stats.models import UserStatistics, DailyStats, XPLog
 from stats.views import _get_real_time_analytics
 from datetime import datetime, timedelta
 
-def test_chart_data_generation():
-    """Test the chart data generation process"""
+def test_chart_data_generation(verbose=False):
+    """
+    Test the chart data generation process.
+    
+    Diagnostic output is collected and written in one go, and only when
+    ``verbose`` is set.
+    """
+    lines = []
     
     # Get admin user
     admin = User.objects.get(username='admin')
-    print(f"Testing chart data for user: {admin.username}")
+    lines.append(f"Testing chart data for user: {admin.username}")
     
     # Get user statistics
     user_stats, created = UserStatistics.objects.get_or_create(user=admin)
-    print(f"User stats: XP={user_stats.total_xp}, Level={user_stats.current_level}")
+    lines.append(f"User stats: XP={user_stats.total_xp}, Level={user_stats.current_level}")
     
     # Get date range (last 30 days)
     end_date = datetime.now().date()
     start_date = end_date - timedelta(days=30)
     
-    # Get daily stats
+    # Stream daily stats as dicts, building chart rows in the same pass
     daily_stats = DailyStats.objects.filter(
         user=admin,
         date__range=[start_date, end_date]
-    ).order_by('date')
+    ).order_by('date').values(
+        'date', 'tasks_completed', 'daily_productivity_score', 'mood_rating'
+    ).iterator(chunk_size=100)
     
-    print(f"Daily stats found: {daily_stats.count()}")
+    daily_productivity = []
+    daily_lines = []
     for stat in daily_stats:
-        print(f"  {stat.date}: {stat.tasks_completed} tasks, {stat.daily_productivity_score} score")
+        daily_lines.append(f"  {stat['date']}: {stat['tasks_completed']} tasks, {stat['daily_productivity_score']} score")
+        daily_productivity.append({
+            'date': stat['date'].strftime('%Y-%m-%d'),
+            'score': float(stat['daily_productivity_score']),
+            'tasks': stat['tasks_completed'],
+            'mood': stat['mood_rating']
+        })
+    
+    lines.append(f"Daily stats found: {len(daily_productivity)}")
+    lines.extend(daily_lines)
     
     # Get recent XP logs
-    recent_xp_logs = XPLog.objects.filter(
+    recent_xp_logs = list(XPLog.objects.filter(
         user_statistics__user=admin
-    ).order_by('-timestamp')[:30]
+    ).order_by('-timestamp').values('timestamp', 'points_earned', 'reason')[:30])
     
-    print(f"XP logs found: {recent_xp_logs.count()}")
+    lines.append(f"XP logs found: {len(recent_xp_logs)}")
     for log in recent_xp_logs[:5]:  # Show first 5
-        print(f"  {log.timestamp}: +{log.points_earned} XP - {log.reason}")
+        lines.append(f"  {log['timestamp']}: +{log['points_earned']} XP - {log['reason']}")
     
     # Real-time analytics data
-    print("\nGenerating real-time analytics...")
+    lines.append("\nGenerating real-time analytics...")
     real_time_data = _get_real_time_analytics(admin)
     
     productivity_trend = real_time_data['productivity_patterns']['productivity_trend']
-    print(f"Productivity trend entries: {len(productivity_trend)}")
+    lines.append(f"Productivity trend entries: {len(productivity_trend)}")
     for entry in productivity_trend[:3]:  # Show first 3
-        print(f"  {entry}")
+        lines.append(f"  {entry}")
     
     # Prepare chart data (same logic as in main view)
     chart_data = {
-        'daily_productivity': [
-            {
-                'date': stat.date.strftime('%Y-%m-%d'),
-                'score': float(stat.daily_productivity_score),
-                'tasks': stat.tasks_completed,
-                'mood': stat.mood_rating
-            }
-            for stat in daily_stats
-        ],
+        'daily_productivity': daily_productivity,
         'xp_progression': [
             {
-                'date': log.timestamp.strftime('%Y-%m-%d'),
+                'date': log['timestamp'].strftime('%Y-%m-%d'),
                 'total_xp': user_stats.total_xp,
-                'points_earned': log.points_earned
+                'points_earned': log['points_earned']
             }
             for log in recent_xp_logs[:10]
         ],
@@ -85,58 +97,61 @@ def test_chart_data_generation():
     
     # Use real-time productivity trend if available
     if productivity_trend:
-        print("Using real-time productivity trend")
+        lines.append("Using real-time productivity trend")
         chart_data['daily_productivity'] = productivity_trend
     
     # Add fallback data if empty
+    rng = np.random.default_rng()
+    fallback_dates = [
+        (end_date - timedelta(days=6-i)).strftime('%Y-%m-%d')
+        for i in range(7)
+    ]
+    
     if not chart_data['daily_productivity']:
-        print("Adding fallback productivity data")
-        import random
+        lines.append("Adding fallback productivity data")
+        scores = rng.integers(30, 86, size=7)
+        tasks_arr = rng.integers(1, 7, size=7)
         chart_data['daily_productivity'] = [
-            {
-                'date': (end_date - timedelta(days=6-i)).strftime('%Y-%m-%d'),
-                'score': float(random.randint(30, 85)),
-                'tasks': random.randint(1, 6),
-                'mood': 5
-            }
-            for i in range(7)
+            {'date': d, 'score': float(s), 'tasks': int(t), 'mood': 5}
+            for d, s, t in zip(fallback_dates, scores, tasks_arr)
         ]
     
     if not chart_data['xp_progression'] or len(chart_data['xp_progression']) < 3:
-        print("Adding fallback XP progression data")
-        import random
-        chart_data['xp_progression'] = []
-        current_xp = max(0, user_stats.total_xp - 100)
+        lines.append("Adding fallback XP progression data")
+        total_xp = user_stats.total_xp
+        start_xp = max(0, total_xp - 100)
         
-        for i in range(7):
-            date = end_date - timedelta(days=6-i)
-            daily_gain = random.randint(5, 25) if current_xp < user_stats.total_xp else 0
-            current_xp += daily_gain
-            
-            chart_data['xp_progression'].append({
-                'date': date.strftime('%Y-%m-%d'),
-                'total_xp': min(current_xp, user_stats.total_xp),
-                'points_earned': daily_gain
-            })
+        # Stop gaining once the running total reaches the real XP
+        gains = rng.integers(5, 26, size=7)
+        previous = start_xp + np.concatenate(([0], np.cumsum(gains)[:-1]))
+        gains = np.where(previous < total_xp, gains, 0)
+        totals = np.minimum(np.cumsum(gains) + start_xp, total_xp)
+        totals[-1] = total_xp
         
-        if chart_data['xp_progression']:
-            chart_data['xp_progression'][-1]['total_xp'] = user_stats.total_xp
+        chart_data['xp_progression'] = [
+            {'date': d, 'total_xp': int(x), 'points_earned': int(g)}
+            for d, x, g in zip(fallback_dates, totals, gains)
+        ]
     
-    print(f"\nFinal chart data:")
-    print(f"Daily productivity entries: {len(chart_data['daily_productivity'])}")
-    print(f"XP progression entries: {len(chart_data['xp_progression'])}")
+    lines.append(f"\nFinal chart data:")
+    lines.append(f"Daily productivity entries: {len(chart_data['daily_productivity'])}")
+    lines.append(f"XP progression entries: {len(chart_data['xp_progression'])}")
     
-    print(f"\nFirst productivity entry: {chart_data['daily_productivity'][0] if chart_data['daily_productivity'] else 'None'}")
-    print(f"First XP entry: {chart_data['xp_progression'][0] if chart_data['xp_progression'] else 'None'}")
+    lines.append(f"\nFirst productivity entry: {chart_data['daily_productivity'][0] if chart_data['daily_productivity'] else 'None'}")
+    lines.append(f"First XP entry: {chart_data['xp_progression'][0] if chart_data['xp_progression'] else 'None'}")
     
     # Test JSON serialization
     try:
-        json_data = json.dumps(chart_data, indent=2)
-        print(f"\nJSON serialization successful, length: {len(json_data)} chars")
-        return chart_data
+        json_data = orjson.dumps(chart_data, option=orjson.OPT_INDENT_2)
+        lines.append(f"\nJSON serialization successful, length: {len(json_data)} bytes")
+        result = chart_data
     except Exception as e:
-        print(f"JSON serialization failed: {e}")
-        return None
+        lines.append(f"JSON serialization failed: {e}")
+        result = None
+    
+    if verbose:
+        sys.stdout.write('\n'.join(lines) + '\n')
+    return result
 
 if __name__ == "__main__":
-    test_chart_data_generation()
+    test_chart_data_generation(verbose='--verbose' in sys.argv[1:])
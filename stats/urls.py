@@ -1,9 +1,17 @@
-from django.urls import path
+from django.urls import include, path
 from . import views
 from .debug_views import debug_chart_data
 
 app_name = 'stats'
 
+streak_patterns = [
+    path('', views.streaks_tracking, name='streaks'),
+    path('create/', views.create_streak, name='create_streak'),
+    path('<int:streak_id>/increment/', views.increment_streak, name='increment_streak'),
+    path('<int:streak_id>/pause/', views.pause_streak, name='pause_streak'),
+    path('<int:streak_id>/reactivate/', views.reactivate_streak, name='reactivate_streak'),
+]
+
 urlpatterns = [
     # Main dashboard
     path('', views.statistics_dashboard, name='dashboard'),
@@ -19,11 +27,7 @@ urlpatterns = [
     path('goals/<int:goal_id>/update/', views.update_goal_progress, name='update_goal_progress'),
     
     # Streaks tracking
-    path('streaks/', views.streaks_tracking, name='streaks'),
-    path('streaks/create/', views.create_streak, name='create_streak'),
-    path('streaks/<int:streak_id>/increment/', views.increment_streak, name='increment_streak'),
-    path('streaks/<int:streak_id>/pause/', views.pause_streak, name='pause_streak'),
-    path('streaks/<int:streak_id>/reactivate/', views.reactivate_streak, name='reactivate_streak'),
+    path('streaks/', include(streak_patterns)),
     
     # Productivity insights
     path('insights/', views.productivity_insights, name='insights'),
@@ -1,18 +1,26 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse
+from django.http import Http404, JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib import messages
+from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
-from django.db.models import Q, Count, Avg, Sum
+from django.db.models import (
+    Q, Count, Sum, F, Case, When, Value, FloatField, DurationField, Window
+)
+from django.db.models.functions import Cast, Least, TruncDate
 from datetime import datetime, timedelta, date
+from functools import lru_cache
 import json
+import random
 
 # API Documentation imports
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework import status
 
@@ -20,9 +28,17 @@ from .models import (
     UserStatistics, DailyStats, AchievementBadge, 
     StreakTracking, UserGoals, XPLog, ProductivityInsights
 )
+from .signals import get_analytics_version
 from tasks.models import Task
+from ohtaskme.renderers import ORJSONRenderer
 from events.models import Event
 
+DASHBOARD_CACHE_TTL = 300  # seconds
+REAL_TIME_ANALYTICS_CACHE_TTL = 75  # seconds
+MOOD_TRACKING_XP = 5
+# Indexed by date.weekday(), Monday first
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
 
 @login_required
 def statistics_dashboard(request):
@@ -35,36 +51,38 @@ def statistics_dashboard(request):
     # Get recent daily stats (last 30 days)
     end_date = timezone.now().date()
     start_date = end_date - timedelta(days=30)
-    daily_stats = DailyStats.objects.filter(
+    # Evaluated once; the weekly/monthly windows and chart rows are all cut
+    # from this list instead of re-querying the table
+    daily_stats_qs = DailyStats.objects.filter(
         user=request.user,
         date__range=[start_date, end_date]
+    ).values(
+        'date', 'daily_productivity_score', 'tasks_completed', 'mood_rating'
     ).order_by('date')
+    daily_stats = list(daily_stats_qs)
     
     # If no daily stats exist, create some sample data for the last 7 days
-    if not daily_stats.exists():
-        from random import randint
+    if not daily_stats:
+        sample_days = []
         for i in range(7):
             date = end_date - timedelta(days=6-i)
             # Create realistic sample data based on tasks and productivity
-            tasks_completed = randint(1, 8)
-            productivity_score = min(tasks_completed * 12.5 + randint(-10, 15), 100)
+            tasks_completed = random.randint(1, 8)
+            productivity_score = min(tasks_completed * 12.5 + random.randint(-10, 15), 100)
             
-            DailyStats.objects.get_or_create(
+            sample_days.append(DailyStats(
                 user=request.user,
                 date=date,
-                defaults={
-                    'tasks_completed': tasks_completed,
-                    'tasks_created': tasks_completed + randint(0, 3),
-                    'daily_productivity_score': max(productivity_score, 0),
-                    'mood_rating': randint(6, 9),
-                    'energy_level': randint(5, 8)
-                }
-            )
-        # Refresh the queryset
-        daily_stats = DailyStats.objects.filter(
-            user=request.user,
-            date__range=[start_date, end_date]
-        ).order_by('date')
+                tasks_completed=tasks_completed,
+                tasks_created=tasks_completed + random.randint(0, 3),
+                daily_productivity_score=max(productivity_score, 0),
+                mood_rating=random.randint(6, 9),
+                energy_level=random.randint(5, 8)
+            ))
+        # A concurrent first load may already have seeded some of these days
+        DailyStats.objects.bulk_create(sample_days, ignore_conflicts=True)
+        # Refresh the list
+        daily_stats = list(daily_stats_qs)
     
     # Get recent achievements (last 10)
     recent_achievements = AchievementBadge.objects.filter(
@@ -83,10 +101,10 @@ def statistics_dashboard(request):
         status='active'
     ).order_by('target_date')
     
-    # Get recent XP logs (last 20)
-    recent_xp_logs = XPLog.objects.filter(
+    # Get recent XP logs (last 20); the template shows each log's running total
+    recent_xp_logs = list(XPLog.objects.filter(
         user_statistics=user_stats
-    ).order_by('-timestamp')[:20]
+    ).select_related('user_statistics').order_by('-timestamp')[:20])
     
     # Get unread insights
     unread_insights = ProductivityInsights.objects.filter(
@@ -95,88 +113,84 @@ def statistics_dashboard(request):
         is_dismissed=False
     ).order_by('-priority', '-created_at')
     
-    # Calculate weekly progress
-    week_start = end_date - timedelta(days=7)
-    this_week_stats = daily_stats.filter(date__gte=week_start)
-    weekly_tasks = sum(stat.tasks_completed for stat in this_week_stats)
-    weekly_productivity = this_week_stats.aggregate(avg_score=Avg('daily_productivity_score'))['avg_score'] or 0
-    
-    # Calculate monthly progress
-    month_start = end_date.replace(day=1)
-    this_month_stats = daily_stats.filter(date__gte=month_start)
-    monthly_tasks = sum(stat.tasks_completed for stat in this_month_stats)
-    monthly_productivity = this_month_stats.aggregate(avg_score=Avg('daily_productivity_score'))['avg_score'] or 0
-    
-    # Real-time analytics data
-    real_time_data = _get_real_time_analytics(request.user)
-    
-    # Prepare chart data using real-time analytics where available
-    chart_data = {
-        'daily_productivity': [
-            {
-                'date': stat.date.strftime('%Y-%m-%d'),
-                'score': float(stat.daily_productivity_score),
-                'tasks': stat.tasks_completed,
-                'mood': stat.mood_rating
-            }
-            for stat in daily_stats
-        ],
-        'xp_progression': [
-            {
-                'date': log.timestamp.strftime('%Y-%m-%d'),
-                'total_xp': user_stats.total_xp,
-                'points_earned': log.points_earned
-            }
-            for log in recent_xp_logs[:10]  # Limit to recent 10 entries
-        ]
-    }
-    
-    # Use real-time productivity trend if available and better
-    if real_time_data['productivity_patterns']['productivity_trend']:
-        chart_data['daily_productivity'] = real_time_data['productivity_patterns']['productivity_trend']
-    
-    # Add fallback data if charts are empty
-    if not chart_data['daily_productivity']:
-        # Create sample data for last 7 days to show chart functionality
-        import random
-        chart_data['daily_productivity'] = [
-            {
-                'date': (end_date - timedelta(days=6-i)).strftime('%Y-%m-%d'),
-                'score': float(random.randint(30, 85)),  # Sample scores
-                'tasks': random.randint(1, 6),  # Sample task counts
-                'mood': 5
-            }
-            for i in range(7)
-        ]
-    
-    # Generate better XP progression data
-    if not chart_data['xp_progression'] or len(chart_data['xp_progression']) < 3:
-        # Create progressive XP data for the last 7 days
-        import random
-        chart_data['xp_progression'] = []
-        current_xp = max(0, user_stats.total_xp - 100)  # Start a bit lower
+    # Any XP change writes an XPLog row and touches user_stats.last_updated,
+    # and task or DailyStats changes bump the analytics version, so all three
+    # go into the key; the TTL bounds staleness from everything else.
+    cache_key = 'stats:dashboard:{}:{}:{}:{}:{}'.format(
+        request.user.pk,
+        end_date.isoformat(),
+        recent_xp_logs[0].pk if recent_xp_logs else 0,
+        user_stats.last_updated.timestamp(),
+        get_analytics_version(request.user.pk),
+    )
+    payload = cache.get(cache_key)
+    if payload is None:
+        # Calculate weekly progress
+        week_start = end_date - timedelta(days=7)
+        this_week_stats = [stat for stat in daily_stats if stat['date'] >= week_start]
+        weekly_tasks = sum(stat['tasks_completed'] for stat in this_week_stats)
+        weekly_productivity = _mean_score(this_week_stats)
         
-        for i in range(7):
-            date = end_date - timedelta(days=6-i)
-            daily_gain = random.randint(5, 25) if current_xp < user_stats.total_xp else 0
-            current_xp += daily_gain
-            
-            chart_data['xp_progression'].append({
-                'date': date.strftime('%Y-%m-%d'),
-                'total_xp': min(current_xp, user_stats.total_xp),
-                'points_earned': daily_gain
-            })
+        # Calculate monthly progress
+        month_start = end_date.replace(day=1)
+        this_month_stats = [stat for stat in daily_stats if stat['date'] >= month_start]
+        monthly_tasks = sum(stat['tasks_completed'] for stat in this_month_stats)
+        monthly_productivity = _mean_score(this_month_stats)
         
-        # Ensure the last entry matches current XP
-        if chart_data['xp_progression']:
-            chart_data['xp_progression'][-1]['total_xp'] = user_stats.total_xp
-    
-    # Add user stats for XP chart
-    chart_data['user_stats'] = {
-        'total_xp': user_stats.total_xp,
-        'current_level': user_stats.current_level,
-        'xp_to_next_level': user_stats.xp_to_next_level,
-    }
+        # Real-time analytics data
+        real_time_data = _get_cached_real_time_analytics(request.user)
+        
+        # Prepare chart data using real-time analytics where available
+        chart_data = {
+            'daily_productivity': [
+                {
+                    'date': stat['date'].isoformat(),
+                    'score': float(stat['daily_productivity_score']),
+                    'tasks': stat['tasks_completed'],
+                    'mood': stat['mood_rating']
+                }
+                for stat in daily_stats
+            ],
+            # Reuses the XP logs already loaded for the template
+            'xp_progression': [
+                {
+                    'date': log.timestamp.date().isoformat(),
+                    'total_xp': user_stats.total_xp,
+                    'points_earned': log.points_earned
+                }
+                for log in recent_xp_logs[:10]  # Limit to recent 10 entries
+            ]
+        }
+        
+        # Use real-time productivity trend if available and better
+        if real_time_data['productivity_patterns']['productivity_trend']:
+            chart_data['daily_productivity'] = real_time_data['productivity_patterns']['productivity_trend']
+        
+        # Add fallback data if charts are empty
+        if not chart_data['daily_productivity']:
+            chart_data['daily_productivity'] = list(_sample_daily_productivity(end_date))
+        
+        # Generate better XP progression data
+        if not chart_data['xp_progression'] or len(chart_data['xp_progression']) < 3:
+            chart_data['xp_progression'] = list(_sample_xp_progression(end_date, user_stats.total_xp))
+        
+        # Add user stats for XP chart
+        chart_data['user_stats'] = {
+            'total_xp': user_stats.total_xp,
+            'current_level': user_stats.current_level,
+            'xp_to_next_level': user_stats.xp_to_next_level,
+        }
+        
+        payload = {
+            'weekly_tasks': weekly_tasks,
+            'weekly_productivity': round(weekly_productivity, 1),
+            'monthly_tasks': monthly_tasks,
+            'monthly_productivity': round(monthly_productivity, 1),
+            'chart_data': chart_data,
+            'real_time_data': real_time_data,
+        }
+        cache.set(cache_key, payload, DASHBOARD_CACHE_TTL)
+    real_time_data = payload['real_time_data']
     
     context = {
         'user_stats': user_stats,
@@ -186,11 +200,11 @@ def statistics_dashboard(request):
         'active_goals': active_goals,
         'recent_xp_logs': recent_xp_logs,
         'unread_insights': unread_insights,
-        'weekly_tasks': weekly_tasks,
-        'weekly_productivity': round(weekly_productivity, 1),
-        'monthly_tasks': monthly_tasks,
-        'monthly_productivity': round(monthly_productivity, 1),
-        'chart_data': chart_data,
+        'weekly_tasks': payload['weekly_tasks'],
+        'weekly_productivity': payload['weekly_productivity'],
+        'monthly_tasks': payload['monthly_tasks'],
+        'monthly_productivity': payload['monthly_productivity'],
+        'chart_data': payload['chart_data'],
         'current_date': end_date,
         
         # Real-time analytics
@@ -205,6 +219,49 @@ def statistics_dashboard(request):
     return render(request, 'stats/dashboard.html', context)
 
 
+@lru_cache(maxsize=32)
+def _sample_daily_productivity(end_date):
+    """Sample productivity points for the 7 days ending ``end_date``, so empty charts still render."""
+    return tuple(
+        {
+            'date': (end_date - timedelta(days=6-i)).isoformat(),
+            'score': float(random.randint(30, 85)),  # Sample scores
+            'tasks': random.randint(1, 6),  # Sample task counts
+            'mood': 5
+        }
+        for i in range(7)
+    )
+
+
+@lru_cache(maxsize=32)
+def _sample_xp_progression(end_date, total_xp):
+    """Progressive sample XP points for the 7 days ending ``end_date``, finishing at ``total_xp``."""
+    progression = []
+    current_xp = max(0, total_xp - 100)  # Start a bit lower
+    
+    for i in range(7):
+        day = end_date - timedelta(days=6-i)
+        daily_gain = random.randint(5, 25) if current_xp < total_xp else 0
+        current_xp += daily_gain
+        
+        progression.append({
+            'date': day.isoformat(),
+            'total_xp': min(current_xp, total_xp),
+            'points_earned': daily_gain
+        })
+    
+    # Ensure the last entry matches current XP
+    progression[-1]['total_xp'] = total_xp
+    return tuple(progression)
+
+
+def _mean_score(daily_rows):
+    """Average ``daily_productivity_score`` over DailyStats value rows (0 if empty)."""
+    if not daily_rows:
+        return 0
+    return sum(row['daily_productivity_score'] for row in daily_rows) / len(daily_rows)
+
+
 @login_required
 def achievements_gallery(request):
     """
@@ -213,24 +270,22 @@ def achievements_gallery(request):
     user_stats, created = UserStatistics.objects.get_or_create(user=request.user)
     
     # Get all achievements grouped by type
-    achievements = AchievementBadge.objects.filter(
+    achievements = list(AchievementBadge.objects.filter(
         user_statistics=user_stats
-    ).order_by('-unlocked_at')
+    ).order_by('-unlocked_at'))
     
     # Group achievements by badge type
     grouped_achievements = {}
     for achievement in achievements:
-        badge_type = achievement.get_badge_type_display()
-        if badge_type not in grouped_achievements:
-            grouped_achievements[badge_type] = []
-        grouped_achievements[badge_type].append(achievement)
-    
-    # Get achievement statistics
-    total_achievements = achievements.count()
-    rare_achievements = achievements.filter(is_rare=True).count()
-    recent_achievements = achievements.filter(
-        unlocked_at__gte=timezone.now() - timedelta(days=7)
-    ).count()
+        grouped_achievements.setdefault(
+            achievement.get_badge_type_display(), []
+        ).append(achievement)
+    
+    # Get achievement statistics from the rows already loaded
+    week_ago = timezone.now() - timedelta(days=7)
+    total_achievements = len(achievements)
+    rare_achievements = sum(1 for achievement in achievements if achievement.is_rare)
+    recent_achievements = sum(1 for achievement in achievements if achievement.unlocked_at >= week_ago)
     
     context = {
         'grouped_achievements': grouped_achievements,
@@ -378,13 +433,13 @@ def increment_streak(request, streak_id):
 def pause_streak(request, streak_id):
     """Pause/deactivate a streak."""
     try:
-        streak = StreakTracking.objects.get(id=streak_id, user=request.user)
-        streak.is_active = False
-        streak.save()
+        updated = StreakTracking.objects.filter(
+            id=streak_id, user=request.user
+        ).update(is_active=False)
+        if not updated:
+            return JsonResponse({'success': False, 'error': 'Streak not found'})
         
         return JsonResponse({'success': True})
-    except StreakTracking.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Streak not found'})
     except Exception as e:
         return JsonResponse({'success': False, 'error': str(e)})
 
@@ -394,15 +449,17 @@ def pause_streak(request, streak_id):
 def reactivate_streak(request, streak_id):
     """Reactivate a paused streak."""
     try:
-        streak = StreakTracking.objects.get(id=streak_id, user=request.user)
-        streak.is_active = True
-        streak.current_count = 0  # Reset current count when reactivating
-        streak.last_updated = timezone.now().date()
-        streak.save()
+        updated = StreakTracking.objects.filter(
+            id=streak_id, user=request.user
+        ).update(
+            is_active=True,
+            current_count=0,  # Reset current count when reactivating
+            last_updated=timezone.now().date()
+        )
+        if not updated:
+            return JsonResponse({'success': False, 'error': 'Streak not found'})
         
         return JsonResponse({'success': True})
-    except StreakTracking.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Streak not found'})
     except Exception as e:
         return JsonResponse({'success': False, 'error': str(e)})
 
@@ -420,18 +477,23 @@ def productivity_insights(request):
         insight_id = request.POST.get('insight_id')
         action = request.POST.get('action')
         
-        insight = get_object_or_404(ProductivityInsights, id=insight_id, user=request.user)
-        
+        # Write the flags with a single UPDATE; no instance needs loading
         if action == 'mark_read':
-            insight.is_read = True
-            insight.save()
+            updates = {'is_read': True}
         elif action == 'dismiss':
-            insight.is_dismissed = True
-            insight.save()
+            updates = {'is_dismissed': True}
         elif action == 'take_action':
-            insight.action_taken = True
-            insight.action_description = request.POST.get('action_description', '')
-            insight.save()
+            updates = {
+                'action_taken': True,
+                'action_description': request.POST.get('action_description', ''),
+            }
+        else:
+            updates = {}
+        
+        own_insight = ProductivityInsights.objects.filter(id=insight_id, user=request.user)
+        found = own_insight.update(**updates) if updates else own_insight.exists()
+        if not found:
+            raise Http404("No ProductivityInsights matches the given query.")
         
         return JsonResponse({'success': True})
     
@@ -464,9 +526,20 @@ def daily_mood_tracking(request):
         
         daily_stats.save()
         
-        # Award XP for mood tracking
+        # Award XP for mood tracking once per day; re-submissions only update the mood
         user_stats, created = UserStatistics.objects.get_or_create(user=request.user)
-        user_stats.add_xp(5, "Daily mood tracking")
+        with transaction.atomic():
+            # Locking the stats row serializes concurrent submissions, so only
+            # one of them can see "not yet awarded"
+            user_stats = UserStatistics.objects.select_for_update().get(pk=user_stats.pk)
+            already_awarded = XPLog.objects.filter(
+                user_statistics=user_stats,
+                reason="Daily mood tracking",
+                timestamp__date=daily_stats.date
+            ).exists()
+            if not already_awarded:
+                # add_xp saves the row, so the achievement signal still runs
+                user_stats.add_xp(MOOD_TRACKING_XP, "Daily mood tracking")
         
         messages.success(request, 'Daily mood and energy levels recorded!')
         return JsonResponse({'success': True})
@@ -487,6 +560,61 @@ def daily_mood_tracking(request):
     return render(request, 'stats/mood_tracking.html', context)
 
 
+# Swagger schema objects for the statistics API, built once at import
+STATS_TYPE_PARAM = openapi.Parameter(
+    'type',
+    openapi.IN_QUERY,
+    description="Type of statistics data to retrieve",
+    type=openapi.TYPE_STRING,
+    enum=['productivity', 'xp', 'streaks', 'goals'],
+    default='productivity'
+)
+STATS_DAYS_PARAM = openapi.Parameter(
+    'days',
+    openapi.IN_QUERY,
+    description="Number of days to include in the data",
+    type=openapi.TYPE_INTEGER,
+    default=30
+)
+STATISTICS_API_RESPONSES = {
+    200: openapi.Response(
+        description="Statistics data",
+        examples={
+            "application/json": {
+                "productivity": [
+                    {
+                        "date": "2024-01-01",
+                        "score": 85,
+                        "tasks_completed": 5,
+                        "events_attended": 3
+                    }
+                ]
+            }
+        }
+    )
+}
+DASHBOARD_API_RESPONSES = {
+    200: openapi.Response(
+        description="Complete dashboard data",
+        examples={
+            "application/json": {
+                "user_statistics": {
+                    "total_xp": 1250,
+                    "current_level": 3,
+                    "completion_rate": 0.85,
+                    "productivity_score": 78
+                },
+                "recent_achievements": [],
+                "active_streaks": [],
+                "current_goals": [],
+                "recent_insights": [],
+                "daily_stats": []
+            }
+        }
+    )
+}
+
+
 @swagger_auto_schema(
     method='get',
     operation_summary="Get Statistics Data",
@@ -499,43 +627,12 @@ def daily_mood_tracking(request):
     - streaks: Current active streaks
     - goals: Goals progress and completion status
     """,
-    manual_parameters=[
-        openapi.Parameter(
-            'type',
-            openapi.IN_QUERY,
-            description="Type of statistics data to retrieve",
-            type=openapi.TYPE_STRING,
-            enum=['productivity', 'xp', 'streaks', 'goals'],
-            default='productivity'
-        ),
-        openapi.Parameter(
-            'days',
-            openapi.IN_QUERY,
-            description="Number of days to include in the data",
-            type=openapi.TYPE_INTEGER,
-            default=30
-        ),
-    ],
-    responses={
-        200: openapi.Response(
-            description="Statistics data",
-            examples={
-                "application/json": {
-                    "productivity": [
-                        {
-                            "date": "2024-01-01",
-                            "score": 85,
-                            "tasks_completed": 5,
-                            "events_attended": 3
-                        }
-                    ]
-                }
-            }
-        )
-    }
+    manual_parameters=[STATS_TYPE_PARAM, STATS_DAYS_PARAM],
+    responses=STATISTICS_API_RESPONSES
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer, BrowsableAPIRenderer])
 def statistics_api(request):
     """
     API endpoint for fetching statistics data for charts and widgets.
@@ -550,11 +647,13 @@ def statistics_api(request):
         daily_stats = DailyStats.objects.filter(
             user=request.user,
             date__range=[start_date, end_date]
+        ).only(
+            'date', 'daily_productivity_score', 'tasks_completed', 'mood_rating', 'energy_level'
         ).order_by('date')
         
         data = [
             {
-                'date': stat.date.strftime('%Y-%m-%d'),
+                'date': stat.date,
                 'productivity_score': stat.daily_productivity_score,
                 'tasks_completed': stat.tasks_completed,
                 'mood_rating': stat.mood_rating,
@@ -565,46 +664,49 @@ def statistics_api(request):
         
     elif data_type == 'xp_progression':
         user_stats = UserStatistics.objects.get(user=request.user)
+        # Running total computed by the database; id breaks timestamp ties
         xp_logs = XPLog.objects.filter(
             user_statistics=user_stats,
             timestamp__date__range=[start_date, end_date]
-        ).order_by('timestamp')
+        ).annotate(
+            running_total=Window(
+                Sum('points_earned'),
+                order_by=[F('timestamp').asc(), F('id').asc()]
+            )
+        ).values(
+            'timestamp', 'points_earned', 'reason', 'running_total'
+        ).order_by('timestamp', 'id')
         
-        running_total = 0
-        data = []
-        for log in xp_logs:
-            running_total += log.points_earned
-            data.append({
-                'date': log.timestamp.strftime('%Y-%m-%d'),
-                'points_earned': log.points_earned,
-                'total_xp': running_total,
-                'reason': log.reason
-            })
+        data = [
+            {
+                'date': log['timestamp'].date(),
+                'points_earned': log['points_earned'],
+                'total_xp': log['running_total'],
+                'reason': log['reason']
+            }
+            for log in xp_logs
+        ]
     
     elif data_type == 'task_completion':
-        tasks = Task.objects.filter(
+        # One row per day, counted by the database
+        per_day = Task.objects.filter(
             owner=request.user,
             created_at__date__range=[start_date, end_date]
-        )
-        
-        completion_data = {}
-        for task in tasks:
-            date_str = task.created_at.date().strftime('%Y-%m-%d')
-            if date_str not in completion_data:
-                completion_data[date_str] = {'created': 0, 'completed': 0}
-            
-            completion_data[date_str]['created'] += 1
-            if task.completed:
-                completion_data[date_str]['completed'] += 1
+        ).annotate(
+            day=TruncDate('created_at')
+        ).values('day').annotate(
+            created=Count('id'),
+            completed=Count('id', filter=Q(completed=True))
+        ).order_by('day')
         
         data = [
             {
-                'date': date,
-                'created': stats['created'],
-                'completed': stats['completed'],
-                'completion_rate': (stats['completed'] / stats['created']) * 100 if stats['created'] > 0 else 0
+                'date': row['day'],
+                'created': row['created'],
+                'completed': row['completed'],
+                'completion_rate': (row['completed'] / row['created']) * 100 if row['created'] > 0 else 0
             }
-            for date, stats in completion_data.items()
+            for row in per_day
         ]
     
     else:
@@ -613,8 +715,9 @@ def statistics_api(request):
     response_data = {
         'type': data_type,
         'data': data,
-        'period_start': start_date.strftime('%Y-%m-%d'),
-        'period_end': end_date.strftime('%Y-%m-%d'),
+        # Dates are left as objects; the renderer writes them as YYYY-MM-DD
+        'period_start': start_date,
+        'period_end': end_date,
         'total_records': len(data)
     }
     
@@ -635,26 +738,7 @@ def statistics_api(request):
     - Recent productivity insights
     - Daily statistics for the past 30 days
     """,
-    responses={
-        200: openapi.Response(
-            description="Complete dashboard data",
-            examples={
-                "application/json": {
-                    "user_statistics": {
-                        "total_xp": 1250,
-                        "current_level": 3,
-                        "completion_rate": 0.85,
-                        "productivity_score": 78
-                    },
-                    "recent_achievements": [],
-                    "active_streaks": [],
-                    "current_goals": [],
-                    "recent_insights": [],
-                    "daily_stats": []
-                }
-            }
-        )
-    }
+    responses=DASHBOARD_API_RESPONSES
 )
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -664,23 +748,24 @@ def dashboard_api(request):
     """
     user = request.user
     user_stats, _ = UserStatistics.objects.get_or_create(user=user)
+    end_date = timezone.now().date()
     
     # Get recent achievements (last 10)
     recent_achievements = AchievementBadge.objects.filter(
         user_statistics=user_stats
     ).order_by('-earned_date')[:10]
     
-    # Get active streaks
-    active_streaks = StreakTracking.objects.filter(
+    # Get active streaks (listed once; the summary reuses the rows)
+    active_streaks = list(StreakTracking.objects.filter(
         user_statistics=user_stats,
         is_active=True
-    )
+    ))
     
     # Get current goals (not completed)
-    current_goals = UserGoals.objects.filter(
-        user=user,
-        is_completed=False
-    ).order_by('target_date')[:5]
+    current_goals = list(_annotate_goal_progress(
+        UserGoals.objects.filter(user=user).exclude(status='completed'),
+        end_date
+    ).order_by('target_date')[:5])
     
     # Get recent insights (last 3)
     recent_insights = ProductivityInsights.objects.filter(
@@ -689,57 +774,126 @@ def dashboard_api(request):
     ).order_by('-generated_date')[:3]
     
     # Get daily stats for last 30 days
-    end_date = timezone.now().date()
     start_date = end_date - timedelta(days=30)
     daily_stats = DailyStats.objects.filter(
         user=user,
         date__range=[start_date, end_date]
     ).order_by('date')
     
-    # Serialize data
-    from .serializers import (
-        UserStatisticsSerializer, AchievementBadgeSerializer,
-        StreakTrackingSerializer, UserGoalsSerializer,
-        ProductivityInsightsSerializer, DailyStatsSerializer
-    )
+    # Serialize data in one pass through the composite dashboard serializer.
+    # Every nested serializer reads only local columns, so the querysets
+    # above need no select_related/prefetch_related.
+    from .serializers import StatisticsDashboardSerializer
     
     response_data = {
-        'user_statistics': UserStatisticsSerializer(user_stats).data,
-        'recent_achievements': AchievementBadgeSerializer(recent_achievements, many=True).data,
-        'active_streaks': StreakTrackingSerializer(active_streaks, many=True).data,
-        'current_goals': UserGoalsSerializer(current_goals, many=True).data,
-        'recent_insights': ProductivityInsightsSerializer(recent_insights, many=True).data,
-        'daily_stats': DailyStatsSerializer(daily_stats, many=True).data,
+        **StatisticsDashboardSerializer({
+            'user_statistics': user_stats,
+            'recent_achievements': recent_achievements,
+            'active_streaks': active_streaks,
+            'current_goals': current_goals,
+            'recent_insights': recent_insights,
+            'daily_stats': daily_stats,
+        }, context={'request': request}).data,
         'summary': {
-            'total_achievements': AchievementBadge.objects.filter(user_statistics=user_stats).count(),
-            'active_goals': current_goals.count(),
-            'best_streak': max([s.best_count for s in active_streaks], default=0),
-            'current_streak': max([s.current_count for s in active_streaks], default=0),
+            'total_achievements': user_stats.achievements.count(),
+            'active_goals': len(current_goals),
+            'best_streak': max((s.best_count for s in active_streaks), default=0),
+            'current_streak': max((s.current_count for s in active_streaks), default=0),
         }
     }
     
     return Response(response_data, status=status.HTTP_200_OK)
 
 
+def _annotate_goal_progress(goals, today):
+    """
+    Annotate a UserGoals queryset with ``progress_pct`` and ``days_left``.
+    
+    Mirrors ``UserGoals.progress_percentage`` / ``days_remaining`` but lets the
+    database compute them for every row in the same query.
+    """
+    return goals.annotate(
+        progress_pct=Case(
+            When(target_value__gt=0, then=Least(
+                Cast('current_progress', FloatField()) * 100.0 / F('target_value'),
+                Value(100.0)
+            )),
+            default=Value(0.0),
+            output_field=FloatField()
+        ),
+        days_left=Case(
+            When(Q(status='completed') | Q(target_date__lte=today), then=Value(timedelta(0))),
+            default=F('target_date') - Value(today),
+            output_field=DurationField()
+        )
+    )
+
+
 # ============================================================================
 # REAL-TIME ANALYTICS FUNCTIONS
 # ============================================================================
 
-def _get_real_time_analytics(user):
+def _get_cached_real_time_analytics(user):
+    """
+    ``_get_real_time_analytics`` memoized per user for a short TTL.
+    
+    The key embeds the user's analytics version, which the stats signals bump
+    when tasks or DailyStats change, so edits show up on the next load, and
+    today's date, so a bundle built before midnight is never served after it.
+    """
+    today = timezone.now().date()
+    cache_key = (
+        f'stats:real_time_analytics:{user.pk}:'
+        f'{today.isoformat()}:{get_analytics_version(user.pk)}'
+    )
+    real_time_data = cache.get(cache_key)
+    if real_time_data is None:
+        real_time_data = _get_real_time_analytics(user, today)
+        cache.set(cache_key, real_time_data, REAL_TIME_ANALYTICS_CACHE_TTL)
+    return real_time_data
+
+def _get_real_time_analytics(user, today=None):
     """
     Generate real-time analytics data for the user.
     This function provides live insights into productivity patterns.
+    
+    The 30-day DailyStats window, the active streaks and today's badge titles
+    are fetched once here and shared by the helpers below, which only slice
+    the in-memory rows. Only the DailyStats and StreakTracking columns those
+    helpers read are loaded. The clock is read once and ``today`` is passed
+    down, so every section agrees on the date even across midnight; callers
+    that already know the date (the cache wrapper) pass it in.
     """
+    if today is None:
+        today = timezone.now().date()
+    stats = list(DailyStats.objects.filter(
+        user=user,
+        date__gte=today - timedelta(days=30)
+    ).only('date', 'daily_productivity_score', 'tasks_completed').order_by('date'))
+    streaks = list(
+        StreakTracking.objects.filter(user=user, is_active=True).only(
+            'streak_name', 'current_count', 'best_count', 'target_count', 'last_updated'
+        ).order_by('-current_count')
+    )
+    badges = list(AchievementBadge.objects.filter(
+        user_statistics__user_id=user.pk,
+        unlocked_at__date=today
+    ).values_list('title', flat=True))
+    
     return {
-        'current_insights': _get_current_insights(user),
-        'productivity_patterns': _get_productivity_patterns(user),
-        'streak_status': _get_streak_status(user),
+        'current_insights': _get_current_insights(user, stats, streaks, badges, today),
+        'productivity_patterns': _get_productivity_patterns(user, stats, today),
+        'streak_status': _get_streak_status(user, streaks, today),
         'time_analysis': _get_time_analysis(user),
-        'habit_insights': _get_habit_insights(user),
-        'weekly_report': _get_weekly_report(user)
+        'habit_insights': _get_habit_insights(user, stats, today),
+        'weekly_report': _get_weekly_report(user, stats, today)
     }
 
-def _get_current_insights(user):
+def _stats_since(stats, start_date):
+    """Rows of a date-ordered DailyStats list on or after ``start_date``."""
+    return [stat for stat in stats if stat.date >= start_date]
+
+def _get_current_insights(user, stats, streaks, badges, today):
     """Get current productivity insights and recommendations."""
     
     insights = {
@@ -751,14 +905,13 @@ def _get_current_insights(user):
     }
     
     # Today's productivity score
-    today = timezone.now().date()
-    today_stats = DailyStats.objects.filter(user=user, date=today).first()
+    stats_by_date = {stat.date: stat for stat in stats}
+    today_stats = stats_by_date.get(today)
     if today_stats:
         insights['today_score'] = today_stats.daily_productivity_score
         
         # Calculate trend (comparing to yesterday)
-        yesterday = today - timedelta(days=1)
-        yesterday_stats = DailyStats.objects.filter(user=user, date=yesterday).first()
+        yesterday_stats = stats_by_date.get(today - timedelta(days=1))
         if yesterday_stats:
             score_diff = today_stats.daily_productivity_score - yesterday_stats.daily_productivity_score
             if score_diff > 10:
@@ -767,35 +920,30 @@ def _get_current_insights(user):
                 insights['trend'] = 'declining'
     
     # Get personalized recommendations
-    insights['recommendations'] = _generate_personalized_recommendations(user)
+    insights['recommendations'] = _generate_personalized_recommendations(user, stats, today)
     
     # Today's achievements
-    insights['achievements_today'] = list(AchievementBadge.objects.filter(
-        user_statistics__user=user,
-        unlocked_at__date=today
-    ).values_list('title', flat=True))
+    insights['achievements_today'] = list(badges)
     
     # Streaks at risk (haven't been updated today)
-    insights['streaks_at_risk'] = list(StreakTracking.objects.filter(
-        user=user,
-        is_active=True,
-        last_updated__lt=today,
-        current_count__gt=0
-    ).values_list('streak_name', flat=True))
+    insights['streaks_at_risk'] = [
+        streak.streak_name for streak in streaks
+        if streak.last_updated < today and streak.current_count > 0
+    ]
     
     return insights
 
-def _generate_personalized_recommendations(user):
+def _generate_personalized_recommendations(user, stats, today):
     """Generate personalized recommendations based on user patterns."""
     
     recommendations = []
     
     # Analyze recent activity
-    last_week = timezone.now().date() - timedelta(days=7)
-    recent_stats = DailyStats.objects.filter(user=user, date__gte=last_week)
+    last_week = today - timedelta(days=7)
+    recent_stats = _stats_since(stats, last_week)
     
-    if recent_stats.exists():
-        avg_tasks = recent_stats.aggregate(avg=Avg('tasks_completed'))['avg'] or 0
+    if recent_stats:
+        avg_tasks = sum(stat.tasks_completed for stat in recent_stats) / len(recent_stats)
         
         if avg_tasks < 2:
             recommendations.append({
@@ -806,15 +954,11 @@ def _generate_personalized_recommendations(user):
     
     return recommendations
 
-def _get_productivity_patterns(user):
+def _get_productivity_patterns(user, stats, today):
     """Analyze user's productivity patterns over time."""
     
     # Last 30 days of data
-    thirty_days_ago = timezone.now().date() - timedelta(days=30)
-    daily_stats = DailyStats.objects.filter(
-        user=user,
-        date__gte=thirty_days_ago
-    ).order_by('date')
+    daily_stats = stats
     
     patterns = {
         'best_day_of_week': None,
@@ -824,33 +968,36 @@ def _get_productivity_patterns(user):
         'productivity_trend': []
     }
     
-    if daily_stats.exists():
-        # Day of week analysis
-        day_averages = {}
+    if daily_stats:
+        # Day of week analysis: running [sum, count] per weekday over the rows
+        # already loaded, named through WEEKDAY_NAMES instead of strftime
+        day_totals = {}
         for stat in daily_stats:
-            day = stat.date.strftime('%A')
-            if day not in day_averages:
-                day_averages[day] = []
-            day_averages[day].append(stat.daily_productivity_score)
+            totals = day_totals.setdefault(stat.date.weekday(), [0.0, 0])
+            totals[0] += stat.daily_productivity_score
+            totals[1] += 1
         
-        day_scores = {day: sum(scores)/len(scores) for day, scores in day_averages.items()}
+        day_scores = {
+            WEEKDAY_NAMES[weekday]: total / count
+            for weekday, (total, count) in day_totals.items()
+        }
         if day_scores:
             patterns['best_day_of_week'] = max(day_scores.keys(), key=lambda x: day_scores[x])
             patterns['worst_day_of_week'] = min(day_scores.keys(), key=lambda x: day_scores[x])
         
         # Average daily tasks
-        patterns['avg_daily_tasks'] = daily_stats.aggregate(avg=Avg('tasks_completed'))['avg'] or 0
+        total_days = len(daily_stats)
+        patterns['avg_daily_tasks'] = sum(stat.tasks_completed for stat in daily_stats) / total_days
         
         # Consistency score (how many days had > 0 tasks)
-        active_days = daily_stats.filter(tasks_completed__gt=0).count()
-        total_days = daily_stats.count()
-        patterns['consistency_score'] = (active_days / total_days * 100) if total_days > 0 else 0
+        active_days = sum(1 for stat in daily_stats if stat.tasks_completed > 0)
+        patterns['consistency_score'] = active_days / total_days * 100
         
         # Productivity trend for chart (last 14 days)
-        recent_stats = daily_stats.filter(date__gte=timezone.now().date() - timedelta(days=14))
+        recent_stats = _stats_since(daily_stats, today - timedelta(days=14))
         patterns['productivity_trend'] = [
             {
-                'date': stat.date.strftime('%Y-%m-%d'),
+                'date': stat.date.isoformat(),
                 'score': float(stat.daily_productivity_score),
                 'tasks': stat.tasks_completed
             } for stat in recent_stats
@@ -858,28 +1005,24 @@ def _get_productivity_patterns(user):
     
     return patterns
 
-def _get_streak_status(user):
+def _get_streak_status(user, streaks, today):
     """Get current status of all user streaks."""
     
-    streaks = StreakTracking.objects.filter(user=user, is_active=True)
-    streak_data = []
-    
-    for streak in streaks:
-        progress_percentage = 0
-        if streak.target_count:
-            progress_percentage = min((streak.current_count / streak.target_count) * 100, 100)
-        
-        streak_data.append({
+    # Rows arrive ordered by current_count, highest first
+    return [
+        {
             'name': streak.streak_name,
             'current': streak.current_count,
             'best': streak.best_count,
             'target': streak.target_count,
-            'progress_percentage': progress_percentage,
-            'days_since_update': (timezone.now().date() - streak.last_updated).days,
+            'progress_percentage': (
+                min((streak.current_count / streak.target_count) * 100, 100)
+                if streak.target_count else 0
+            ),
+            'days_since_update': (today - streak.last_updated).days,
             'is_hot': streak.current_count >= 3
-        })
-    
-    return sorted(streak_data, key=lambda x: x['current'], reverse=True)
+        } for streak in streaks
+    ]
 
 def _get_time_analysis(user):
     """Analyze task completion timing patterns."""
@@ -892,18 +1035,18 @@ def _get_time_analysis(user):
     
     return analysis
 
-def _get_habit_insights(user):
+def _get_habit_insights(user, stats, today):
     """Generate insights about habit formation and behavior patterns."""
     
     insights = []
     
     # Analyze recent patterns
-    last_week = timezone.now().date() - timedelta(days=7)
-    recent_stats = DailyStats.objects.filter(user=user, date__gte=last_week)
+    last_week = today - timedelta(days=7)
+    recent_stats = _stats_since(stats, last_week)
     
-    if recent_stats.exists():
-        avg_score = recent_stats.aggregate(avg=Avg('daily_productivity_score'))['avg'] or 0
-        active_days = recent_stats.filter(tasks_completed__gt=0).count()
+    if recent_stats:
+        avg_score = sum(stat.daily_productivity_score for stat in recent_stats) / len(recent_stats)
+        active_days = sum(1 for stat in recent_stats if stat.tasks_completed > 0)
         
         if avg_score >= 70:
             insights.append({
@@ -934,28 +1077,38 @@ def _get_habit_insights(user):
     
     return insights
 
-def _get_weekly_report(user):
+def _get_weekly_report(user, stats, today):
     """Generate a comprehensive weekly productivity report."""
     
-    week_start = timezone.now().date() - timedelta(days=timezone.now().weekday())
-    week_stats = DailyStats.objects.filter(
-        user=user,
-        date__gte=week_start
-    )
+    week_start = today - timedelta(days=today.weekday())
+    week_stats = _stats_since(stats, week_start)
+    
+    # Totals, active days and the best active day in a single pass
+    total_tasks = 0
+    total_score = 0
+    active_days = 0
+    best_day_stat = None
+    for stat in week_stats:
+        total_tasks += stat.tasks_completed
+        total_score += stat.daily_productivity_score
+        if stat.tasks_completed > 0:
+            active_days += 1
+            if (best_day_stat is None or
+                    stat.daily_productivity_score > best_day_stat.daily_productivity_score):
+                best_day_stat = stat
     
     report = {
-        'total_tasks': week_stats.aggregate(total=Sum('tasks_completed'))['total'] or 0,
-        'avg_daily_score': week_stats.aggregate(avg=Avg('daily_productivity_score'))['avg'] or 0,
-        'active_days': week_stats.filter(tasks_completed__gt=0).count(),
+        'total_tasks': total_tasks,
+        'avg_daily_score': total_score / len(week_stats) if week_stats else 0,
+        'active_days': active_days,
         'best_day': None,
         'areas_for_improvement': []
     }
     
-    # Find best day
-    best_day_stat = week_stats.filter(tasks_completed__gt=0).order_by('-daily_productivity_score').first()
+    # Best day
     if best_day_stat:
         report['best_day'] = {
-            'date': best_day_stat.date.strftime('%A'),
+            'date': WEEKDAY_NAMES[best_day_stat.date.weekday()],
             'score': best_day_stat.daily_productivity_score,
             'tasks': best_day_stat.tasks_completed
         }
@@ -10,6 +10,10 @@ class TaskAdmin(admin.ModelAdmin):
     list_filter = ('completed', 'created_at', 'scheduled_time')
     search_fields = ('description', 'owner__username')
     date_hierarchy = 'scheduled_time'
+    ordering = ('-scheduled_time',)
+    list_select_related = ('owner',)
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ('created_at', 'updated_at', 'completed_at')
     fieldsets = (
         (None, {
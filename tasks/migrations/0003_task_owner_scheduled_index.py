@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-16 05:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_task_owner_completed_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['owner', 'scheduled_time'], name='tasks_task_owner_i_e7744a_idx'),
+        ),
+    ]
@@ -77,6 +77,24 @@ class Task(models.Model):
         verbose_name = _('task')
         verbose_name_plural = _('tasks')
         ordering = ['scheduled_time']
+        indexes = [
+            # Today/upcoming lookups: owner + scheduled time range
+            models.Index(fields=['owner', 'scheduled_time']),
+            # Overdue lookups: owner + open tasks scheduled before now; only
+            # open tasks are indexed, so completed history does not bloat it
+            models.Index(
+                fields=['owner', 'scheduled_time'],
+                name='task_overdue_idx',
+                condition=models.Q(completed=False)
+            ),
+            # Completion lookups: owner + done tasks finished in a window
+            models.Index(fields=['owner', 'completed', 'completed_at']),
+        ]
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Completion state as loaded, so saves can tell whether it changed
+        self._original_completed = self.__dict__.get('completed')
     
     def __str__(self):
         """
@@ -91,7 +109,7 @@ class Task(models.Model):
         from django.utils import timezone
         self.completed = True
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=['completed', 'completed_at', 'updated_at'])
         
     def mark_as_incomplete(self):
         """
@@ -99,4 +117,4 @@ class Task(models.Model):
         """
         self.completed = False
         self.completed_at = None
-        self.save()
+        self.save(update_fields=['completed', 'completed_at', 'updated_at'])
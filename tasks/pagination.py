@@ -0,0 +1,17 @@
+from rest_framework.pagination import PageNumberPagination
+
+class TaskPagination(PageNumberPagination):
+    """
+    Pagination for the Task API.
+    
+    Keeps the project's default page size and page-number links, and lets
+    clients pick a size with ``?page_size=`` up to a fixed ceiling, so no
+    request can pull a user's whole task table in one response.
+    
+    Example usage:
+    
+    - Second page of 10 tasks: ?page=2
+    - First 50 tasks: ?page_size=50
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = 200
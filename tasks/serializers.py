@@ -1,8 +1,19 @@
 from rest_framework import serializers
 from django.utils import timezone
+from ohtaskme.serializers import CachedFieldsMixin
 from .models import Task
 
-class TaskSerializer(serializers.ModelSerializer):
+
+def format_datetime(value):
+    """Render a datetime the way DRF's DateTimeField does (ISO 8601, 'Z' for UTC)."""
+    if value is None:
+        return None
+    value = timezone.localtime(value).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+class TaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Default serializer for Task model.
     
@@ -25,14 +36,31 @@ class TaskSerializer(serializers.ModelSerializer):
                   'updated_at', 'completed', 'completed_at', 'event']
         read_only_fields = ['id', 'created_at', 'updated_at', 'completed_at']
     
+    def to_representation(self, instance):
+        """
+        Return the task as a plain dict.
+        
+        The fields are flat, so they are read directly instead of through
+        the per-field serializer loop; the output matches the declared fields.
+        """
+        return {
+            'id': instance.pk,
+            'description': instance.description,
+            'scheduled_time': format_datetime(instance.scheduled_time),
+            'created_at': format_datetime(instance.created_at),
+            'updated_at': format_datetime(instance.updated_at),
+            'completed': instance.completed,
+            'completed_at': format_datetime(instance.completed_at),
+            'event': instance.event_id,
+        }
+    
     def create(self, validated_data):
         """
         Create a new task for the current user.
         """
-        # Get the current user from the context
-        user = self.context['request'].user
-        # Create the task with the user as owner
-        task = Task.objects.create(owner=user, **validated_data)
+        # Create the task owned by the current user; only the key is needed,
+        # the stats signals reload the owner themselves
+        task = Task.objects.create(owner_id=self.context['request'].user.pk, **validated_data)
         return task
 
 class TaskDetailSerializer(TaskSerializer):
@@ -50,8 +78,16 @@ class TaskDetailSerializer(TaskSerializer):
     class Meta(TaskSerializer.Meta):
         fields = TaskSerializer.Meta.fields + ['owner']
         read_only_fields = TaskSerializer.Meta.read_only_fields + ['owner']
+    
+    def to_representation(self, instance):
+        """
+        Return the task as a plain dict, including its owner.
+        """
+        data = super().to_representation(instance)
+        data['owner'] = instance.owner_id
+        return data
 
-class TaskUpdateSerializer(serializers.ModelSerializer):
+class TaskUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating a Task.
     
@@ -73,19 +109,17 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         """
         Update a task and handle completion status changes.
+        
+        The completion timestamp is set alongside the other fields so the
+        task is written with a single save.
         """
         was_completed = instance.completed
         is_completed = validated_data.get('completed', was_completed)
         
-        # Call the parent update method
-        instance = super().update(instance, validated_data)
-        
         # Handle completion status change
         if is_completed and not was_completed:
-            instance.completed_at = timezone.now()
-            instance.save()
+            validated_data['completed_at'] = timezone.now()
         elif not is_completed and was_completed:
-            instance.completed_at = None
-            instance.save()
-            
-        return instance
+            validated_data['completed_at'] = None
+        
+        return super().update(instance, validated_data)
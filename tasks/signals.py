@@ -0,0 +1,37 @@
+"""
+Cache invalidation for the task API.
+
+Cached task listings embed a per-user version counter in their keys. Any
+committed task write or delete bumps the owner's counter, so the next
+request misses the cache and reads fresh rows.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Task
+
+
+def get_task_list_version(user_id):
+    """Return the per-user counter that cached task listings embed."""
+    return cache.get(f'tasks:list_version:{user_id}', 0)
+
+
+def bump_task_list_version(user_id):
+    """Move a user's cached task listings to fresh keys after their tasks change."""
+    key = f'tasks:list_version:{user_id}'
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def invalidate_task_lists(sender, instance, **kwargs):
+    """Expire the owner's cached task listings once the change commits."""
+    if instance.owner_id:
+        owner_id = instance.owner_id
+        transaction.on_commit(lambda: bump_task_list_version(owner_id))
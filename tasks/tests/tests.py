@@ -1,5 +1,6 @@
 from django.test import TestCase
 from django.urls import reverse
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework.test import APIClient
@@ -7,6 +8,7 @@ from rest_framework import status
 import datetime
 
 from tasks.models import Task
+from tasks.serializers import TaskSerializer
 
 User = get_user_model()
 
@@ -14,20 +16,21 @@ class TaskModelTests(TestCase):
     """
     Test suite for the Task model.
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up test data.
+        Set up test data once for the whole class.
         """
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpassword123',
             timezone='UTC'
         )
-        self.task = Task.objects.create(
+        cls.task = Task.objects.create(
             description='Test Task',
             scheduled_time=timezone.now() + datetime.timedelta(days=1),
-            owner=self.user
+            owner=cls.user
         )
     
     def test_task_creation(self):
@@ -60,27 +63,33 @@ class TaskAPITests(TestCase):
     """
     Test suite for the Task API.
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up test client and users.
+        Set up the user and task once for the whole class.
         """
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpassword123',
             timezone='UTC'
         )
+        cls.task = Task.objects.create(
+            description='Existing Task',
+            scheduled_time=timezone.now() + datetime.timedelta(days=2),
+            owner=cls.user
+        )
+    
+    def setUp(self):
+        """
+        Set up test client.
+        """
+        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
         self.task_data = {
             'description': 'Test API Task',
             'scheduled_time': (timezone.now() + datetime.timedelta(days=1)).isoformat()
         }
-        self.task = Task.objects.create(
-            description='Existing Task',
-            scheduled_time=timezone.now() + datetime.timedelta(days=2),
-            owner=self.user
-        )
     
     def test_create_task(self):
         """
@@ -91,6 +100,14 @@ class TaskAPITests(TestCase):
         self.assertEqual(Task.objects.count(), 2)
         self.assertEqual(Task.objects.filter(description='Test API Task').count(), 1)
     
+    def test_list_tasks(self):
+        """
+        Test that the task list matches TaskSerializer's output.
+        """
+        response = self.client.get(reverse('tasks:task-list'), format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [TaskSerializer(self.task).data])
+    
     def test_retrieve_task(self):
         """
         Test retrieving a task via the API.
@@ -113,6 +130,51 @@ class TaskAPITests(TestCase):
         self.task.refresh_from_db()
         self.assertEqual(self.task.description, 'Updated Task')
     
+    def test_today_cache_refreshes_after_task_change(self):
+        """
+        Test that a cached today listing picks up a newly created task.
+        """
+        cache.clear()
+        url = reverse('tasks:task-today')
+        response = self.client.get(url, format='json')
+        self.assertEqual(response.data['results'], [])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(
+                description='Today Task',
+                scheduled_time=timezone.now(),
+                owner=self.user
+            )
+        response = self.client.get(url, format='json')
+        self.assertEqual(
+            [task['description'] for task in response.data['results']],
+            ['Today Task']
+        )
+    
+    def test_today_cache_follows_timezone_change(self):
+        """
+        Test that changing the user's timezone doesn't serve a stale today listing.
+        """
+        cache.clear()
+        url = reverse('tasks:task-today')
+        response = self.client.get(url, format='json')
+        self.assertEqual(response.data['results'], [])
+        
+        # Without on-commit callbacks the list version stays put, so only the
+        # timezone in the key can make the new task visible
+        Task.objects.create(
+            description='Today Task',
+            scheduled_time=timezone.now(),
+            owner=self.user
+        )
+        self.user.timezone = 'Asia/Tokyo'
+        self.user.save(update_fields=['timezone'])
+        response = self.client.get(url, format='json')
+        self.assertEqual(
+            [task['description'] for task in response.data['results']],
+            ['Today Task']
+        )
+    
     def test_delete_task(self):
         """
         Test deleting a task via the API.
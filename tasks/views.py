@@ -1,15 +1,125 @@
 from rest_framework import viewsets, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.renderers import BrowsableAPIRenderer
 from django_filters.rest_framework import DjangoFilterBackend
+from django.core.cache import cache
 from django.utils import timezone
+from django.utils.functional import cached_property
+from datetime import datetime, time, timedelta
+import pytz
 from django.db.models import Q
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from ohtaskme.renderers import ORJSONRenderer
 from .models import Task
-from .serializers import TaskSerializer, TaskDetailSerializer, TaskUpdateSerializer
+from .serializers import (
+    TaskSerializer, TaskDetailSerializer, TaskUpdateSerializer, format_datetime
+)
 from .filters import TaskFilter
+from .pagination import TaskPagination
+from .signals import get_task_list_version
+
+TODAY_CACHE_TTL = 60  # seconds
+
+# Columns of a TaskSerializer row, read straight from the cursor by the list
+# endpoints; 'event' comes back as the event's primary key
+TASK_LIST_FIELDS = (
+    'id', 'description', 'scheduled_time', 'created_at',
+    'updated_at', 'completed', 'completed_at', 'event'
+)
+TASK_DATETIME_FIELDS = ('scheduled_time', 'created_at', 'updated_at', 'completed_at')
+
+
+# Swagger schema objects for the task API, built once at import
+TASK_LIST_PARAMS = [
+    openapi.Parameter(
+        'start_date', 
+        openapi.IN_QUERY, 
+        description="Filter tasks with scheduled_time on or after this date (YYYY-MM-DD)", 
+        type=openapi.TYPE_STRING, 
+        format=openapi.FORMAT_DATE
+    ),
+    openapi.Parameter(
+        'end_date', 
+        openapi.IN_QUERY, 
+        description="Filter tasks with scheduled_time on or before this date (YYYY-MM-DD)", 
+        type=openapi.TYPE_STRING, 
+        format=openapi.FORMAT_DATE
+    ),
+    openapi.Parameter(
+        'completed', 
+        openapi.IN_QUERY, 
+        description="Filter tasks by completion status (true/false)", 
+        type=openapi.TYPE_BOOLEAN
+    ),
+    openapi.Parameter(
+        'search', 
+        openapi.IN_QUERY, 
+        description="Search tasks by description", 
+        type=openapi.TYPE_STRING
+    ),
+    openapi.Parameter(
+        'ordering', 
+        openapi.IN_QUERY, 
+        description="Order tasks by field (e.g. scheduled_time, -scheduled_time for descending)", 
+        type=openapi.TYPE_STRING
+    )
+]
+TASK_PAGINATION_PARAMS = [
+    openapi.Parameter(
+        'page', 
+        openapi.IN_QUERY, 
+        description="Page number for pagination", 
+        type=openapi.TYPE_INTEGER
+    ),
+    openapi.Parameter(
+        'page_size', 
+        openapi.IN_QUERY, 
+        description="Number of items per page", 
+        type=openapi.TYPE_INTEGER
+    )
+]
+TASK_LIST_EXAMPLES = {
+    "application/json": {
+        "count": 2,
+        "next": None,
+        "previous": None,
+        "results": [
+            {
+                "id": 1,
+                "description": "Complete project report",
+                "scheduled_time": "2025-08-15T15:30:00Z",
+                "created_at": "2025-08-01T12:00:00Z",
+                "updated_at": "2025-08-01T12:00:00Z",
+                "completed": False,
+                "completed_at": None,
+                "event": None
+            },
+            {
+                "id": 2,
+                "description": "Team meeting preparation",
+                "scheduled_time": "2025-08-16T09:00:00Z",
+                "created_at": "2025-08-02T10:00:00Z",
+                "updated_at": "2025-08-02T10:00:00Z",
+                "completed": True,
+                "completed_at": "2025-08-03T15:45:00Z",
+                "event": 1
+            }
+        ]
+    }
+}
+TASK_LIST_RESPONSES = {
+    200: TaskSerializer(many=True),
+    401: "Authentication credentials were not provided."
+}
+TASK_DETAIL_RESPONSES = {
+    200: TaskDetailSerializer,
+    401: "Authentication credentials were not provided.",
+    404: "Not found."
+}
+
 
 class TaskViewSet(viewsets.ModelViewSet):
     """
@@ -33,6 +143,8 @@ class TaskViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = TaskFilter
+    pagination_class = TaskPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     search_fields = ['description']
     ordering_fields = ['scheduled_time', 'created_at', 'updated_at']
     ordering = ['scheduled_time']
@@ -40,16 +152,28 @@ class TaskViewSet(viewsets.ModelViewSet):
     # Add a tag for all actions in this viewset
     swagger_tags = ['tasks']
 
-    def get_queryset(self):
+    @cached_property
+    def _user_tasks(self):
         """
-        Return tasks for the current authenticated user only.
+        The current user's tasks, built once per request.
+        
+        Only ``get_queryset`` hands it out, and always as a clone.
         """
         # Handle the case when this is called during schema generation
         if getattr(self, 'swagger_fake_view', False):
             # Return an empty queryset
             return Task.objects.none()
             
-        return Task.objects.filter(owner=self.request.user)
+        return Task.objects.filter(owner_id=self.request.user.pk)
+    
+    def get_queryset(self):
+        """
+        Return tasks for the current authenticated user only.
+        
+        Cloned with ``.all()`` like DRF's own ``get_queryset``, so no caller
+        ever shares another's result cache.
+        """
+        return self._user_tasks.all()
     
     def get_serializer_class(self):
         """
@@ -64,76 +188,32 @@ class TaskViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(
         operation_description="List all tasks for the authenticated user.",
         operation_id="tasks_list",
-        responses={
-            200: TaskSerializer(many=True),
-            401: "Authentication credentials were not provided."
-        },
-        manual_parameters=[
-            openapi.Parameter(
-                'start_date', 
-                openapi.IN_QUERY, 
-                description="Filter tasks with scheduled_time on or after this date (YYYY-MM-DD)", 
-                type=openapi.TYPE_STRING, 
-                format=openapi.FORMAT_DATE
-            ),
-            openapi.Parameter(
-                'end_date', 
-                openapi.IN_QUERY, 
-                description="Filter tasks with scheduled_time on or before this date (YYYY-MM-DD)", 
-                type=openapi.TYPE_STRING, 
-                format=openapi.FORMAT_DATE
-            ),
-            openapi.Parameter(
-                'completed', 
-                openapi.IN_QUERY, 
-                description="Filter tasks by completion status (true/false)", 
-                type=openapi.TYPE_BOOLEAN
-            ),
-            openapi.Parameter(
-                'search', 
-                openapi.IN_QUERY, 
-                description="Search tasks by description", 
-                type=openapi.TYPE_STRING
-            ),
-            openapi.Parameter(
-                'ordering', 
-                openapi.IN_QUERY, 
-                description="Order tasks by field (e.g. scheduled_time, -scheduled_time for descending)", 
-                type=openapi.TYPE_STRING
-            )
-        ],
-        examples={
-            "application/json": {
-                "count": 2,
-                "next": None,
-                "previous": None,
-                "results": [
-                    {
-                        "id": 1,
-                        "description": "Complete project report",
-                        "scheduled_time": "2025-08-15T15:30:00Z",
-                        "created_at": "2025-08-01T12:00:00Z",
-                        "updated_at": "2025-08-01T12:00:00Z",
-                        "completed": False,
-                        "completed_at": None,
-                        "event": None
-                    },
-                    {
-                        "id": 2,
-                        "description": "Team meeting preparation",
-                        "scheduled_time": "2025-08-16T09:00:00Z",
-                        "created_at": "2025-08-02T10:00:00Z",
-                        "updated_at": "2025-08-02T10:00:00Z",
-                        "completed": True,
-                        "completed_at": "2025-08-03T15:45:00Z",
-                        "event": 1
-                    }
-                ]
-            }
-        }
+        responses=TASK_LIST_RESPONSES,
+        manual_parameters=TASK_LIST_PARAMS,
+        examples=TASK_LIST_EXAMPLES
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        return self._fast_list(self.filter_queryset(self.get_queryset()))
+    
+    def _fast_list(self, queryset):
+        """
+        Paginated TaskSerializer-shaped rows built from ``.values()``.
+        
+        The list endpoints return flat task rows, so the rows are read as
+        dicts and only the datetimes are formatted, skipping the per-field
+        serializer machinery. The output matches ``TaskSerializer``.
+        """
+        rows = queryset.values(*TASK_LIST_FIELDS)
+        page = self.paginate_queryset(rows)
+        data = [
+            {
+                **row,
+                **{field: format_datetime(row[field]) for field in TASK_DATETIME_FIELDS}
+            } for row in (rows if page is None else page)
+        ]
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
     
     @swagger_auto_schema(
         operation_description="Create a new task.",
@@ -151,11 +231,7 @@ class TaskViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(
         operation_description="Retrieve a specific task.",
         operation_id="tasks_read",
-        responses={
-            200: TaskDetailSerializer,
-            401: "Authentication credentials were not provided.",
-            404: "Not found."
-        }
+        responses=TASK_DETAIL_RESPONSES
     )
     def retrieve(self, request, *args, **kwargs):
         return super().retrieve(request, *args, **kwargs)
@@ -178,11 +254,7 @@ class TaskViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(
         operation_description="Mark a task as completed.",
         operation_id="tasks_complete",
-        responses={
-            200: TaskDetailSerializer,
-            401: "Authentication credentials were not provided.",
-            404: "Not found."
-        }
+        responses=TASK_DETAIL_RESPONSES
     )
     def complete(self, request, pk=None):
         """
@@ -191,18 +263,16 @@ class TaskViewSet(viewsets.ModelViewSet):
         Sets the completed flag to True and records the completion timestamp.
         """
         task = self.get_object()
-        task.mark_as_completed()
+        # Already completed: keep the original timestamp and skip the UPDATE
+        if not task.completed:
+            task.mark_as_completed()
         return Response(TaskDetailSerializer(task).data)
     
     @action(detail=True, methods=['post'])
     @swagger_auto_schema(
         operation_description="Mark a task as incomplete.",
         operation_id="tasks_incomplete",
-        responses={
-            200: TaskDetailSerializer,
-            401: "Authentication credentials were not provided.",
-            404: "Not found."
-        }
+        responses=TASK_DETAIL_RESPONSES
     )
     def incomplete(self, request, pk=None):
         """
@@ -211,31 +281,17 @@ class TaskViewSet(viewsets.ModelViewSet):
         Sets the completed flag to False and clears the completion timestamp.
         """
         task = self.get_object()
-        task.mark_as_incomplete()
+        # Already open: nothing to write
+        if task.completed:
+            task.mark_as_incomplete()
         return Response(TaskDetailSerializer(task).data)
     
     @action(detail=False, methods=['get'])
     @swagger_auto_schema(
         operation_description="List all tasks scheduled for today.",
         operation_id="tasks_today",
-        responses={
-            200: TaskSerializer(many=True),
-            401: "Authentication credentials were not provided."
-        },
-        manual_parameters=[
-            openapi.Parameter(
-                'page', 
-                openapi.IN_QUERY, 
-                description="Page number for pagination", 
-                type=openapi.TYPE_INTEGER
-            ),
-            openapi.Parameter(
-                'page_size', 
-                openapi.IN_QUERY, 
-                description="Number of items per page", 
-                type=openapi.TYPE_INTEGER
-            )
-        ]
+        responses=TASK_LIST_RESPONSES,
+        manual_parameters=TASK_PAGINATION_PARAMS
     )
     def today(self, request):
         """
@@ -244,17 +300,31 @@ class TaskViewSet(viewsets.ModelViewSet):
         Returns all tasks belonging to the authenticated user that are scheduled
         for the current date, based on the user's timezone setting.
         """
-        today = timezone.localtime().date()
-        tasks = self.get_queryset().filter(
-            scheduled_time__date=today
-        )
-        page = self.paginate_queryset(tasks)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        # Half-open range on the raw column so the index applies, instead of
+        # a DATE() cast on every row; the day runs midnight to midnight in the
+        # user's own timezone
+        user_tz = pytz.timezone(request.user.timezone)
+        today = datetime.now(user_tz).date()
+        start = user_tz.localize(datetime.combine(today, time.min))
+        end = user_tz.localize(datetime.combine(today + timedelta(days=1), time.min))
         
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        # Cached per user, timezone, day and page; task writes bump the list
+        # version and a timezone change moves to a new key. The payload's
+        # next/previous links are absolute, so scheme and host are keyed too
+        cache_key = (
+            f'tasks:today:{request.user.pk}:{request.user.timezone}:{today.isoformat()}:'
+            f'{get_task_list_version(request.user.pk)}:'
+            f'{request.scheme}://{request.get_host()}:{request.query_params.urlencode()}'
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            tasks = self.get_queryset().filter(
+                scheduled_time__gte=start,
+                scheduled_time__lt=end
+            )
+            data = self._fast_list(tasks).data
+            cache.set(cache_key, data, TODAY_CACHE_TTL)
+        return Response(data)
     
     @action(detail=False, methods=['get'])
     @swagger_auto_schema(
@@ -269,13 +339,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         tasks = self.get_queryset().filter(
             scheduled_time__gt=now
         )
-        page = self.paginate_queryset(tasks)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        return self._fast_list(tasks)
     
     @action(detail=False, methods=['get'])
     @swagger_auto_schema(
@@ -291,10 +355,4 @@ class TaskViewSet(viewsets.ModelViewSet):
             scheduled_time__lt=now,
             completed=False
         )
-        page = self.paginate_queryset(tasks)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(tasks, many=True)
-        return Response(serializer.data)
+        return self._fast_list(tasks)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from pathlib import Path
+import pytz
+
+import users
+
+HEADER = '''"""
+Frozen copy of ``pytz.common_timezones``.
+
+Generated by ``manage.py generate_tz_data``; regenerate after upgrading pytz
+rather than editing by hand.
+"""
+
+TZ_NAMES = (
+'''
+
+
+class Command(BaseCommand):
+    help = 'Regenerate users/_tz_data.py from pytz.common_timezones'
+
+    def handle(self, *args, **options):
+        path = Path(users.__file__).resolve().parent / '_tz_data.py'
+        body = ''.join(f'    {name!r},\n' for name in pytz.common_timezones)
+        path.write_text(HEADER + body + ')\n')
+        
+        self.stdout.write(
+            self.style.SUCCESS(f'Wrote {len(pytz.common_timezones)} timezones to {path}')
+        )
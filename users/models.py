@@ -1,7 +1,12 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils.translation import gettext_lazy as _
-import pytz
+from ._tz_data import TZ_NAMES
+
+# Built once at import from the frozen pytz list: choices for the timezone
+# field, and the same names as a frozenset for constant-time membership checks
+TIMEZONE_CHOICES = tuple(zip(TZ_NAMES, TZ_NAMES))
+TIMEZONE_NAMES = frozenset(TZ_NAMES)
 
 class User(AbstractUser):
     """
@@ -15,7 +20,10 @@ class User(AbstractUser):
     TODO: Add productivity pattern analysis and optimization features
     TODO: Integrate with machine learning models for personalized recommendations
     """
-    TIMEZONE_CHOICES = [(tz, tz) for tz in pytz.common_timezones]
+    TIMEZONE_CHOICES = TIMEZONE_CHOICES
+    
+    # Indexed for password reset and registration lookups by address
+    email = models.EmailField(_('email address'), blank=True, db_index=True)
     
     timezone = models.CharField(
         _('timezone'),
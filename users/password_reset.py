@@ -1,17 +1,98 @@
 from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
-from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
 from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
 from rest_framework import status, serializers
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
+from rest_framework.settings import api_settings
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import hmac
+import logging
+import textwrap
 
-User = get_user_model()
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+RESET_EMAIL_SUBJECT = "Password Reset Request"
+RESET_EMAIL_BODY = "Please reset your password by clicking the link below:\n\n{reset_url}"
+
+# Swagger objects for the reset endpoints, built once at import
+RESET_REQUEST_DESCRIPTION = textwrap.dedent("""
+    Send a password reset email to the user.
+    
+    This endpoint accepts an email address and sends a password reset
+    email if a user with that email exists. For security reasons,
+    the endpoint always returns success even if the email doesn't exist.
+    
+    The email contains a secure token that expires after a set time period.
+""").strip()
+RESET_CONFIRM_DESCRIPTION = textwrap.dedent("""
+    Complete the password reset process using the token from email.
+    
+    This endpoint accepts the UID and token from the password reset email,
+    along with the new password. It verifies the token and updates the
+    user's password if everything is valid.
+    
+    The token has an expiration time and can only be used once.
+""").strip()
+RESET_REQUEST_RESPONSES = {
+    200: openapi.Response(
+        description="Password reset email sent (or would be sent)",
+        examples={
+            "application/json": {
+                "message": "If an account with that email exists, a password reset email has been sent."
+            }
+        }
+    ),
+    400: openapi.Response(description="Invalid email format")
+}
+RESET_CONFIRM_RESPONSES = {
+    200: openapi.Response(
+        description="Password reset successful",
+        examples={
+            "application/json": {
+                "message": "Password has been reset successfully."
+            }
+        }
+    ),
+    400: openapi.Response(
+        description="Invalid token, passwords don't match, or other validation error",
+        examples={
+            "application/json": {
+                "error": "Invalid token or user ID."
+            }
+        }
+    )
+}
+
+# Stand-in hashed for unknown addresses so both branches cost the same
+_DUMMY_USER = User(email='')
+
+# SMTP delivery runs here so the request does not wait on the mail server
+_mail_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='password-reset-mail')
+
+
+def _send_reset_email(email, reset_url):
+    """Deliver a password reset email; failures are logged, not raised."""
+    try:
+        send_mail(
+            subject=RESET_EMAIL_SUBJECT,
+            message=RESET_EMAIL_BODY.format(reset_url=reset_url),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[email],
+            fail_silently=False,
+        )
+    except Exception:
+        logger.exception("Failed to send password reset email")
 
 class PasswordResetRequestSerializer(serializers.Serializer):
     """
@@ -32,11 +113,40 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         """
         Validate that passwords match and meet Django's password requirements.
         """
-        if attrs['new_password'] != attrs['confirm_password']:
+        if not hmac.compare_digest(attrs['new_password'].encode(), attrs['confirm_password'].encode()):
             raise serializers.ValidationError({"password": "Password fields didn't match."})
         
         return attrs
 
+def _clean_reset_email(data):
+    """
+    Validate the reset request's single email field without a serializer.
+    
+    Applies the same checks and messages as the ``EmailField`` on
+    ``PasswordResetRequestSerializer``, which stays the documented schema.
+    Returns ``(email, errors)``; ``errors`` is empty when the email is valid.
+    """
+    if not isinstance(data, Mapping):
+        message = serializers.Serializer.default_error_messages['invalid'].format(
+            datatype=type(data).__name__
+        )
+        return None, {api_settings.NON_FIELD_ERRORS_KEY: [message]}
+    if 'email' not in data:
+        return None, {'email': [serializers.Field.default_error_messages['required']]}
+    email = data['email']
+    if email is None:
+        return None, {'email': [serializers.Field.default_error_messages['null']]}
+    if not isinstance(email, str):
+        return None, {'email': [serializers.EmailField.default_error_messages['invalid']]}
+    email = email.strip()
+    if not email:
+        return None, {'email': [serializers.CharField.default_error_messages['blank']]}
+    try:
+        validate_email(email)
+    except DjangoValidationError:
+        return None, {'email': [serializers.EmailField.default_error_messages['invalid']]}
+    return email, {}
+
 class PasswordResetRequestView(APIView):
     """
     API view to request a password reset.
@@ -49,63 +159,36 @@ class PasswordResetRequestView(APIView):
 
     @swagger_auto_schema(
         operation_summary="Request Password Reset",
-        operation_description="""
-        Send a password reset email to the user.
-        
-        This endpoint accepts an email address and sends a password reset
-        email if a user with that email exists. For security reasons,
-        the endpoint always returns success even if the email doesn't exist.
-        
-        The email contains a secure token that expires after a set time period.
-        """,
+        operation_description=RESET_REQUEST_DESCRIPTION,
         request_body=PasswordResetRequestSerializer,
-        responses={
-            200: openapi.Response(
-                description="Password reset email sent (or would be sent)",
-                examples={
-                    "application/json": {
-                        "message": "If an account with that email exists, a password reset email has been sent."
-                    }
-                }
-            ),
-            400: openapi.Response(description="Invalid email format")
-        }
+        responses=RESET_REQUEST_RESPONSES
     )
     def post(self, request):
-        serializer = self.serializer_class(data=request.data)
-        if serializer.is_valid():
-            email = serializer.validated_data['email']
+        email, errors = _clean_reset_email(request.data)
+        if not errors:
+            # Only the columns the token hashes are loaded
+            user = User.objects.filter(email=email).only(
+                'pk', 'password', 'last_login', 'email'
+            ).first()
             
-            try:
-                user = User.objects.get(email=email)
-                # Generate token
-                token = default_token_generator.make_token(user)
+            # We don't want to reveal which emails are in the database, so an
+            # unknown address still pays for a token and gets the same reply
+            token = default_token_generator.make_token(user or _DUMMY_USER)
+            if user is not None:
                 uid = urlsafe_base64_encode(force_bytes(user.pk))
                 
                 # Build reset URL (frontend would handle this route)
                 reset_url = f"{settings.FRONTEND_URL}/reset-password/{uid}/{token}/"
                 
-                # Send email
-                send_mail(
-                    subject="Password Reset Request",
-                    message=f"Please reset your password by clicking the link below:\n\n{reset_url}",
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[email],
-                    fail_silently=False,
-                )
-                
-                return Response(
-                    {"detail": "Password reset email has been sent."},
-                    status=status.HTTP_200_OK
-                )
-            except User.DoesNotExist:
-                # We don't want to reveal which emails are in the database
-                return Response(
-                    {"detail": "Password reset email has been sent."},
-                    status=status.HTTP_200_OK
-                )
+                # Send email in the background
+                _mail_executor.submit(_send_reset_email, email, reset_url)
+            
+            return Response(
+                {"detail": "Password reset email has been sent."},
+                status=status.HTTP_200_OK
+            )
         
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
 class PasswordResetConfirmView(APIView):
     """
@@ -119,47 +202,23 @@ class PasswordResetConfirmView(APIView):
 
     @swagger_auto_schema(
         operation_summary="Confirm Password Reset",
-        operation_description="""
-        Complete the password reset process using the token from email.
-        
-        This endpoint accepts the UID and token from the password reset email,
-        along with the new password. It verifies the token and updates the
-        user's password if everything is valid.
-        
-        The token has an expiration time and can only be used once.
-        """,
+        operation_description=RESET_CONFIRM_DESCRIPTION,
         request_body=PasswordResetConfirmSerializer,
-        responses={
-            200: openapi.Response(
-                description="Password reset successful",
-                examples={
-                    "application/json": {
-                        "message": "Password has been reset successfully."
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Invalid token, passwords don't match, or other validation error",
-                examples={
-                    "application/json": {
-                        "error": "Invalid token or user ID."
-                    }
-                }
-            )
-        }
+        responses=RESET_CONFIRM_RESPONSES
     )
     def post(self, request):
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             try:
                 uid = force_str(urlsafe_base64_decode(serializer.validated_data['uid']))
-                user = User.objects.get(pk=uid)
+                # Only the columns the token check hashes are loaded
+                user = User.objects.only('pk', 'password', 'last_login', 'email').get(pk=uid)
                 
                 # Verify token
                 if default_token_generator.check_token(user, serializer.validated_data['token']):
                     # Set new password
                     user.set_password(serializer.validated_data['new_password'])
-                    user.save()
+                    user.save(update_fields=['password'])
                     
                     return Response(
                         {"detail": "Password has been reset successfully."},
@@ -1,11 +1,38 @@
 from rest_framework import serializers
-from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
 
-User = get_user_model()
+from ohtaskme.serializers import CachedFieldsMixin, SparseFieldsMixin
+from .models import User, TIMEZONE_NAMES
+import hmac
 
-class UserCreateSerializer(serializers.ModelSerializer):
+
+class TimezoneField(serializers.CharField):
+    """
+    Timezone name checked against the frozen ``TIMEZONE_NAMES`` set.
+    
+    Replaces the ``ChoiceField`` ModelSerializer would build from the
+    model's ~430 choices on every serializer instance; membership is a
+    single set lookup.
+    """
+    default_error_messages = {
+        'invalid_choice': _('"{input}" is not a valid choice.')
+    }
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('max_length', 50)
+        kwargs.setdefault('required', False)
+        super().__init__(**kwargs)
+    
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if value not in TIMEZONE_NAMES:
+            self.fail('invalid_choice', input=data)
+        return value
+
+
+class UserCreateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user registration.
     
@@ -13,20 +40,20 @@ class UserCreateSerializer(serializers.ModelSerializer):
     """
     password = serializers.CharField(write_only=True, required=True, style={'input_type': 'password'})
     password_confirm = serializers.CharField(write_only=True, required=True, style={'input_type': 'password'})
+    timezone = TimezoneField()
     
     class Meta:
         model = User
         fields = ['username', 'email', 'password', 'password_confirm', 'timezone']
         extra_kwargs = {
-            'email': {'required': True},
-            'timezone': {'required': False}
+            'email': {'required': True}
         }
     
     def validate(self, attrs):
         """
         Validate that the passwords match and meet Django's password requirements.
         """
-        if attrs['password'] != attrs['password_confirm']:
+        if not hmac.compare_digest(attrs['password'].encode(), attrs['password_confirm'].encode()):
             raise serializers.ValidationError({"password": "Password fields didn't match."})
         
         try:
@@ -50,24 +77,38 @@ class UserCreateSerializer(serializers.ModelSerializer):
         return user
 
 
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(SparseFieldsMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for displaying user details.
     
-    Used for user profile display and updates.
+    Used for user profile display and updates. Pass ``fields`` to return
+    only a subset of the columns.
     """
+    timezone = TimezoneField()
+    
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'timezone']
         read_only_fields = ['id', 'username', 'email']
 
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+class UserUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating user profile information.
     
     Allows updating first_name, last_name, and timezone.
     """
+    timezone = TimezoneField()
+    
     class Meta:
         model = User
         fields = ['first_name', 'last_name', 'timezone']
+    
+    def update(self, instance, validated_data):
+        """
+        Apply the changes and write only the submitted columns.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data))
+        return instance
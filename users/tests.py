@@ -10,17 +10,23 @@ class AuthenticationTests(TestCase):
     """
     Test suite for authentication endpoints.
     """
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
-        Set up test client and create a test user.
+        Create the test user once for the whole class.
         """
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpassword123',
             timezone='UTC'
         )
+
+    def setUp(self):
+        """
+        Set up test client and endpoint URLs.
+        """
+        self.client = APIClient()
         self.register_url = reverse('users:register')
         self.token_url = reverse('users:token_obtain_pair')
         self.token_refresh_url = reverse('users:token_refresh')
@@ -43,6 +49,60 @@ class AuthenticationTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(User.objects.filter(username='newuser').exists())
 
+    def test_bulk_registration(self):
+        """
+        Test that staff can register several users in one request.
+        """
+        url = reverse('users:register_bulk')
+        data = [
+            {
+                'username': f'bulkuser{i}',
+                'email': f'bulkuser{i}@example.com',
+                'password': 'newpassword123',
+                'password_confirm': 'newpassword123',
+            }
+            for i in range(2)
+        ]
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'adminpassword123')
+        self.client.force_authenticate(user=admin)
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        user = User.objects.get(username='bulkuser1')
+        self.assertTrue(user.check_password('newpassword123'))
+        self.assertEqual(user.timezone, 'UTC')
+
+    def test_bulk_registration_rejects_duplicates_in_batch(self):
+        """
+        Test that usernames equal after normalization are a 400, while
+        usernames differing only by case are accepted like single registrations.
+        """
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'adminpassword123')
+        self.client.force_authenticate(user=admin)
+        url = reverse('users:register_bulk')
+        
+        def batch(*usernames):
+            return [
+                {
+                    'username': username,
+                    'email': f'bulk{i}@example.com',
+                    'password': 'newpassword123',
+                    'password_confirm': 'newpassword123',
+                }
+                for i, username in enumerate(usernames)
+            ]
+        
+        response = self.client.post(url, batch('bulkuser', ' bulkuser '), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('username', response.data)
+        self.assertFalse(User.objects.filter(username='bulkuser').exists())
+        
+        response = self.client.post(url, batch('bulkuser', 'BulkUser'), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     def test_user_login(self):
         """
         Test user login and token generation.
@@ -97,6 +157,31 @@ class AuthenticationTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['username'], 'testuser')
 
+    def test_profile_sparse_fields(self):
+        """
+        Test that ?fields= limits the profile response to the listed fields.
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.profile_url, {'fields': 'username,timezone'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'username': 'testuser', 'timezone': 'UTC'})
+
+    def test_profile_not_modified(self):
+        """
+        Test that a matching If-None-Match returns 304 until the profile changes.
+        """
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.profile_url)
+        etag = response['ETag']
+        
+        response = self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        self.client.patch(self.profile_url, {'first_name': 'Changed'}, format='json')
+        response = self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
     def test_password_reset_request(self):
         """
         Test password reset request endpoint.
@@ -106,3 +191,24 @@ class AuthenticationTests(TestCase):
         }
         response = self.client.post(self.password_reset_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_password_reset_request_rejects_non_object_body(self):
+        """
+        Test that a JSON body that isn't an object is a 400, not a server error.
+        """
+        for body in ([], 'x'):
+            response = self.client.post(self.password_reset_url, body, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('non_field_errors', response.data)
+
+    def test_password_reset_request_null_email(self):
+        """
+        Test that null and missing emails get DRF's distinct messages.
+        """
+        response = self.client.post(self.password_reset_url, {'email': None}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['email'], ['This field may not be null.'])
+        
+        response = self.client.post(self.password_reset_url, {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['email'], ['This field is required.'])
@@ -1,17 +1,19 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .views import RegisterView, UserProfileView
+from .views import RegisterView, BulkRegisterView, UserProfileView
 from .password_reset import PasswordResetRequestView, PasswordResetConfirmView
 
 app_name = 'users'
 
 urlpatterns = [
-    # Authentication endpoints
-    path('register/', RegisterView.as_view(), name='register'),
-    path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    # Authentication endpoints, most frequently hit first since the
+    # resolver tries patterns in order
     path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('profile/', UserProfileView.as_view(), name='profile'),
+    path('token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
+    path('register/', RegisterView.as_view(), name='register'),
+    path('register/bulk/', BulkRegisterView.as_view(), name='register_bulk'),
     
     # Password reset endpoints
     path('password-reset/', PasswordResetRequestView.as_view(), name='password_reset_request'),
@@ -1,13 +1,115 @@
-from rest_framework import generics, permissions, status
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
+import textwrap
+
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework import generics, permissions, status, serializers
 from rest_framework.response import Response
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
-from django.contrib.auth import get_user_model
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
+from ohtaskme.renderers import ORJSONRenderer
+from .models import User
 from .serializers import UserCreateSerializer, UserDetailSerializer, UserUpdateSerializer
 
-User = get_user_model()
+# Swagger objects for the user API, built once at import
+REGISTER_DESCRIPTION = textwrap.dedent("""
+    Register a new user account in the system.
+    
+    This endpoint creates a new user with the provided credentials.
+    No authentication is required for this endpoint.
+    
+    Features:
+    - Email validation and uniqueness checking
+    - Password strength validation
+    - Automatic timezone detection and setup
+    - User profile initialization
+""").strip()
+BULK_REGISTER_DESCRIPTION = textwrap.dedent("""
+    Register a list of users in a single request.
+    
+    Each entry is validated like a normal registration. Passwords are
+    hashed in parallel and the users are inserted together; if any
+    entry is invalid, nothing is created.
+""").strip()
+PROFILE_GET_DESCRIPTION = textwrap.dedent("""
+    Retrieve the authenticated user's profile information.
+    
+    Returns complete user profile data including:
+    - Basic user information (username, email, first/last name)
+    - User preferences and settings
+    - Timezone information
+    - Account creation and last login dates
+    
+    Use the `fields` query parameter to request only some fields.
+""").strip()
+PROFILE_PATCH_DESCRIPTION = textwrap.dedent("""
+    Update the authenticated user's profile information.
+    
+    Allows partial updates of user profile fields including:
+    - Name fields (first_name, last_name)
+    - Timezone preferences
+    - Other profile settings
+    
+    Password changes should be done through dedicated password change endpoints.
+""").strip()
+PROFILE_FIELDS_PARAM = openapi.Parameter(
+    'fields',
+    openapi.IN_QUERY,
+    description="Comma-separated profile fields to return (e.g. first_name,timezone)",
+    type=openapi.TYPE_STRING
+)
+AUTH_REQUIRED_RESPONSE = openapi.Response(description="Authentication required")
+REGISTER_RESPONSES = {
+    201: openapi.Response(
+        description="User registered successfully",
+        schema=UserDetailSerializer
+    ),
+    400: openapi.Response(
+        description="Validation errors",
+        examples={
+            "application/json": {
+                "email": ["User with this email already exists."],
+                "password": ["This password is too common."]
+            }
+        }
+    )
+}
+PROFILE_GET_RESPONSES = {
+    200: openapi.Response(
+        description="User profile data",
+        schema=UserDetailSerializer
+    ),
+    401: AUTH_REQUIRED_RESPONSE
+}
+PROFILE_PATCH_RESPONSES = {
+    200: openapi.Response(
+        description="Profile updated successfully",
+        schema=UserDetailSerializer
+    ),
+    400: openapi.Response(description="Validation errors"),
+    401: AUTH_REQUIRED_RESPONSE
+}
+
+BULK_REGISTER_RESPONSES = {
+    201: openapi.Response(
+        description="Users registered successfully",
+        schema=UserDetailSerializer(many=True)
+    ),
+    400: openapi.Response(description="Validation errors, one entry per submitted user"),
+    403: openapi.Response(description="Admin access required")
+}
+
+# PBKDF2 releases the GIL inside hashlib, so password hashes for a bulk
+# import can run on every core
+_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='bulk-register-hash')
 
 
 class RegisterView(generics.CreateAPIView):
@@ -16,43 +118,76 @@ class RegisterView(generics.CreateAPIView):
     
     This endpoint is publicly accessible (no authentication required).
     """
-    queryset = User.objects.all()
+    # Never enumerated by CreateAPIView; deferred so an accidental
+    # list(get_queryset()) doesn't pull whole user rows
+    queryset = User.objects.only('pk')
     serializer_class = UserCreateSerializer
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'register'
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     @swagger_auto_schema(
         operation_summary="Register New User",
-        operation_description="""
-        Register a new user account in the system.
-        
-        This endpoint creates a new user with the provided credentials.
-        No authentication is required for this endpoint.
-        
-        Features:
-        - Email validation and uniqueness checking
-        - Password strength validation
-        - Automatic timezone detection and setup
-        - User profile initialization
-        """,
+        operation_description=REGISTER_DESCRIPTION,
         request_body=UserCreateSerializer,
-        responses={
-            201: openapi.Response(
-                description="User registered successfully",
-                schema=UserDetailSerializer
-            ),
-            400: openapi.Response(
-                description="Validation errors",
-                examples={
-                    "application/json": {
-                        "email": ["User with this email already exists."],
-                        "password": ["This password is too common."]
-                    }
-                }
-            )
-        }
+        responses=REGISTER_RESPONSES
     )
     def post(self, request, *args, **kwargs):
-        return super().post(request, *args, **kwargs)
+        # Call the mixin action directly rather than bouncing through super()
+        return self.create(request, *args, **kwargs)
+
+
+class BulkRegisterView(APIView):
+    """
+    API view to register many users in one request.
+    
+    Intended for seeding and admin imports, so it is restricted to staff.
+    """
+    permission_classes = [permissions.IsAdminUser]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
+    @swagger_auto_schema(
+        operation_summary="Bulk Register Users",
+        operation_description=BULK_REGISTER_DESCRIPTION,
+        request_body=UserCreateSerializer(many=True),
+        responses=BULK_REGISTER_RESPONSES
+    )
+    def post(self, request):
+        serializer = UserCreateSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        entries = serializer.validated_data
+        
+        users = [
+            User(
+                username=User.normalize_username(entry['username']),
+                email=User.objects.normalize_email(entry['email']),
+                timezone=entry.get('timezone', 'UTC')
+            )
+            for entry in entries
+        ]
+        
+        # The unique validators only see existing rows, not the rest of the
+        # batch; compare the normalized usernames exactly, as the
+        # (case-sensitive) unique constraint will
+        usernames = [user.username for user in users]
+        if len(set(usernames)) != len(usernames):
+            raise serializers.ValidationError({"username": ["Usernames in the batch must be unique."]})
+        
+        passwords = _hash_executor.map(make_password, [entry['password'] for entry in entries])
+        for user, password in zip(users, passwords):
+            user.password = password
+        
+        # bulk_create wraps all batches in one transaction, so a conflict
+        # (e.g. a concurrent registration) rolls back the whole batch
+        try:
+            User.objects.bulk_create(users, batch_size=500)
+        except IntegrityError as exc:
+            raise serializers.ValidationError(
+                {"username": ["A user with one of these usernames already exists."]}
+            ) from exc
+        
+        return Response(UserDetailSerializer(users, many=True).data, status=status.HTTP_201_CREATED)
 
 
 class UserProfileView(generics.RetrieveUpdateAPIView):
@@ -63,53 +198,53 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     """
     serializer_class = UserDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'profile'
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    
+    # Write methods use the narrower update serializer; reads fall back to detail
+    _SERIALIZER_BY_METHOD = {
+        'PATCH': UserUpdateSerializer,
+        'PUT': UserUpdateSerializer,
+    }
     
     @swagger_auto_schema(
         operation_summary="Get User Profile",
-        operation_description="""
-        Retrieve the authenticated user's profile information.
-        
-        Returns complete user profile data including:
-        - Basic user information (username, email, first/last name)
-        - User preferences and settings
-        - Timezone information
-        - Account creation and last login dates
-        """,
-        responses={
-            200: openapi.Response(
-                description="User profile data",
-                schema=UserDetailSerializer
-            ),
-            401: openapi.Response(description="Authentication required")
-        }
+        operation_description=PROFILE_GET_DESCRIPTION,
+        manual_parameters=[PROFILE_FIELDS_PARAM],
+        responses=PROFILE_GET_RESPONSES
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        # The user was resolved by authentication and the permission check
+        # ran in initial(), so skip get_object()/retrieve() entirely
+        etag = self._profile_etag(request)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        serializer = self.get_serializer(request.user)
+        response = Response(serializer.data)
+        response['ETag'] = etag
+        return response
 
     @swagger_auto_schema(
         operation_summary="Update User Profile",
-        operation_description="""
-        Update the authenticated user's profile information.
-        
-        Allows partial updates of user profile fields including:
-        - Name fields (first_name, last_name)
-        - Timezone preferences
-        - Other profile settings
-        
-        Password changes should be done through dedicated password change endpoints.
-        """,
+        operation_description=PROFILE_PATCH_DESCRIPTION,
         request_body=UserUpdateSerializer,
-        responses={
-            200: openapi.Response(
-                description="Profile updated successfully",
-                schema=UserDetailSerializer
-            ),
-            400: openapi.Response(description="Validation errors"),
-            401: openapi.Response(description="Authentication required")
-        }
+        responses=PROFILE_PATCH_RESPONSES
     )
     def patch(self, request, *args, **kwargs):
-        return super().patch(request, *args, **kwargs)
+        return self.partial_update(request, *args, **kwargs)
+    
+    def _profile_etag(self, request):
+        """
+        Fingerprint the serialized columns of the already-loaded user, plus
+        any ``?fields=`` selection, so unchanged profiles answer 304.
+        """
+        user = request.user
+        values = [str(getattr(user, name)) for name in UserDetailSerializer.Meta.fields]
+        values.append(request.query_params.get('fields', ''))
+        digest = hashlib.md5('\x1f'.join(values).encode(), usedforsecurity=False).hexdigest()
+        return quote_etag(digest)
     
     def get_object(self):
         """
@@ -117,10 +252,17 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         """
         return self.request.user
     
+    def get_serializer(self, *args, **kwargs):
+        """
+        Narrow the profile GET output to the ``?fields=`` list when given.
+        """
+        fields = self.request.query_params.get('fields')
+        if fields and self.request.method == 'GET':
+            kwargs['fields'] = frozenset(fields.split(','))
+        return super().get_serializer(*args, **kwargs)
+    
     def get_serializer_class(self):
         """
         Return different serializers based on the HTTP method.
         """
-        if self.request.method == 'PATCH':
-            return UserUpdateSerializer
-        return UserDetailSerializer
+        return self._SERIALIZER_BY_METHOD.get(self.request.method, UserDetailSerializer)